@@ -1,6 +1,149 @@
 first_diagonal_traversal = [(0,0),(1,1),(2,2)]
 second_diagonal_traversal = [(0,2),(1,1),(2,0)]
 
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # columns
+    (0, 4, 8), (2, 4, 6),             # diagonals
+)
+
+# Bitboard encoding
+# A BitBoard keeps one 9-bit mask per player; bit i*3+j is cell (i, j).
+# Winning is a mask test against the 8 line masks (tabulated for all 512
+# masks) and empty cells come from bit iteration, so the search functions
+# below allocate nothing per node when given a BitBoard.
+FULL_MASK = 0b111111111
+LINE_MASKS = tuple(sum(1 << k for k in line) for line in WIN_LINES)
+NO_LINE = len(LINE_MASKS)
+
+def _first_line(mask):
+    for idx, line in enumerate(LINE_MASKS):
+        if mask & line == line:
+            return idx
+    return NO_LINE
+
+# Index of the first completed line (in check_winner's row, column,
+# diagonal order) for every mask, so both players resolve like check_winner
+FIRST_LINE = tuple(_first_line(m) for m in range(FULL_MASK + 1))
+
+class BitBoard:
+    """3x3 board stored as an 'X' mask and an 'O' mask"""
+    def __init__(self, x=0, o=0):
+        self.x = x
+        self.o = o
+
+    @classmethod
+    def from_board(cls, board):
+        """Build a BitBoard from a list-of-rows board"""
+        x = o = 0
+        for i in range(3):
+            for j in range(3):
+                if board[i][j] == 'X':
+                    x |= 1 << (i * 3 + j)
+                elif board[i][j] == 'O':
+                    o |= 1 << (i * 3 + j)
+        return cls(x, o)
+
+    def to_board(self):
+        """Convert back to a list-of-rows board"""
+        return [[self.get(i, j) for j in range(3)] for i in range(3)]
+
+    def mask(self, symbol):
+        if symbol == 'X':
+            return self.x
+        if symbol == 'O':
+            return self.o
+        return 0
+
+    def get(self, i, j):
+        bit = 1 << (i * 3 + j)
+        if self.x & bit:
+            return 'X'
+        if self.o & bit:
+            return 'O'
+        return ' '
+
+    def set(self, i, j, symbol):
+        bit = 1 << (i * 3 + j)
+        self.x &= ~bit
+        self.o &= ~bit
+        if symbol == 'X':
+            self.x |= bit
+        elif symbol == 'O':
+            self.o |= bit
+
+    # board[i][j] reads and writes work as on a list-of-rows board
+    def __getitem__(self, i):
+        if not 0 <= i < 3:
+            raise IndexError(i)
+        return _BitRow(self, i)
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return (_BitRow(self, i) for i in range(3))
+
+    def __eq__(self, other):
+        return isinstance(other, BitBoard) and self.x == other.x and self.o == other.o
+
+    def __repr__(self):
+        return f"BitBoard(x={self.x:#011b}, o={self.o:#011b})"
+
+class _BitRow:
+    def __init__(self, bitboard, i):
+        self.bitboard = bitboard
+        self.i = i
+
+    def __getitem__(self, j):
+        if not 0 <= j < 3:
+            raise IndexError(j)
+        return self.bitboard.get(self.i, j)
+
+    def __setitem__(self, j, symbol):
+        if not 0 <= j < 3:
+            raise IndexError(j)
+        self.bitboard.set(self.i, j, symbol)
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return (self.bitboard.get(self.i, j) for j in range(3))
+
+    def count(self, symbol):
+        return sum(1 for v in self if v == symbol)
+
+def _minimax_masks(mine, theirs, depth, is_maximizing):
+    """minimax() on raw masks: mine is the AI player, theirs the opponent"""
+    mine_line, theirs_line = FIRST_LINE[mine], FIRST_LINE[theirs]
+    if mine_line < theirs_line:
+        return 10 - depth
+    if theirs_line < mine_line:
+        return depth - 10
+    free = FULL_MASK & ~(mine | theirs)
+    if not free:
+        return 0
+
+    if is_maximizing:
+        max_eval = float('-inf')
+        while free:
+            bit = free & -free
+            free ^= bit
+            eval_score = _minimax_masks(mine | bit, theirs, depth + 1, False)
+            if eval_score > max_eval:
+                max_eval = eval_score
+        return max_eval
+    else:
+        min_eval = float('inf')
+        while free:
+            bit = free & -free
+            free ^= bit
+            eval_score = _minimax_masks(mine, theirs | bit, depth + 1, True)
+            if eval_score < min_eval:
+                min_eval = eval_score
+        return min_eval
+
 def horizontal_traversal(num):
     max_val = 3
     list_indices = []
@@ -17,6 +160,14 @@ def vertical_traversal(num):
 
 def check_winner(board):
     """Check if there's a winner on the board"""
+    if isinstance(board, BitBoard):
+        x_line, o_line = FIRST_LINE[board.x], FIRST_LINE[board.o]
+        if x_line < o_line:
+            return 'X'
+        if o_line < x_line:
+            return 'O'
+        return None
+
     # Check all rows
     for i in range(3):
         row = horizontal_traversal(i)
@@ -45,6 +196,8 @@ def check_winner(board):
 
 def is_board_full(board):
     """Check if the board is full"""
+    if isinstance(board, BitBoard):
+        return board.x | board.o == FULL_MASK
     for i in range(3):
         for j in range(3):
             if board[i][j] == ' ':
@@ -53,6 +206,15 @@ def is_board_full(board):
 
 def get_empty_cells(board):
     """Get list of empty cells"""
+    if isinstance(board, BitBoard):
+        empty_cells = []
+        free = FULL_MASK & ~(board.x | board.o)
+        while free:
+            bit = free & -free
+            free ^= bit
+            k = bit.bit_length() - 1
+            empty_cells.append((k // 3, k % 3))
+        return empty_cells
     empty_cells = []
     for i in range(3):
         for j in range(3):
@@ -68,7 +230,11 @@ def minimax(board, depth, is_maximizing, player, opponent):
     is_maximizing: True if maximizing player's turn, False otherwise
     player: symbol for AI player (typically 'O')
     opponent: symbol for human player (typically 'X')
+    board may also be a BitBoard, searched on its masks without allocation
     """
+    if isinstance(board, BitBoard):
+        return _minimax_masks(board.mask(player), board.mask(opponent), depth, is_maximizing)
+
     winner = check_winner(board)
    
     # Base cases
@@ -104,11 +270,26 @@ def minimax(board, depth, is_maximizing, player, opponent):
        
         return min_eval
 
-def find_best_move(board, player, opponent):
+def search_best_move(board, player, opponent):
     """
-    Find the best move for the AI player
+    Find the best move for the AI player by a full minimax search
     Returns tuple (row, col) of best move
     """
+    if isinstance(board, BitBoard):
+        mine, theirs = board.mask(player), board.mask(opponent)
+        best_score = float('-inf')
+        best_move = None
+        free = FULL_MASK & ~(mine | theirs)
+        while free:
+            bit = free & -free
+            free ^= bit
+            score = _minimax_masks(mine | bit, theirs, 0, False)
+            if score > best_score:
+                best_score = score
+                k = bit.bit_length() - 1
+                best_move = (k // 3, k % 3)
+        return best_move
+
     best_score = float('-inf')
     best_move = None
     empty_cells = get_empty_cells(board)
@@ -125,6 +306,145 @@ def find_best_move(board, player, opponent):
    
     return best_move
 
+# Perfect-play table
+# The whole game is solved once into a dict keyed by a base-3 board code
+# (0 = empty, 1 = side to move, 2 = other side), so the same table serves
+# 'X' and 'O'. Each board is stored only in its canonical orientation (the
+# smallest code among its 8 rotations/reflections), which leaves 627
+# canonical states with a move to make (4,520 before symmetry reduction).
+# The value is a 9-tuple of move scores in that orientation, using the same
+# scale as minimax(board, 0, False, ...) so move choice is unchanged.
+# Cell permutations: transformed[k] = cells[perm[k]]
+SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror left-right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror top-bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # anti diagonal
+)
+
+POWERS_OF_3 = tuple(3 ** k for k in range(9))
+
+_perfect_play_table = {}
+_solved_table = None  # read-only snapshot of the reachable states
+
+def encode_cells(cells):
+    """Encode a 9-tuple of 0/1/2 cells as a base-3 integer"""
+    return sum(v * p for v, p in zip(cells, POWERS_OF_3))
+
+def board_to_cells(board, player, opponent):
+    """Flatten a 3x3 board into a 9-tuple relative to player (1) and opponent (2)"""
+    if isinstance(board, BitBoard):
+        mine, theirs = board.mask(player), board.mask(opponent)
+        return tuple(1 if mine >> k & 1 else 2 if theirs >> k & 1 else 0 for k in range(9))
+    cells = []
+    for i in range(3):
+        for j in range(3):
+            v = board[i][j]
+            cells.append(1 if v == player else 2 if v == opponent else 0)
+    return tuple(cells)
+
+def canonical_form(cells):
+    """Return (code, perm) of the smallest-coded symmetric image of cells"""
+    best_code = None
+    best_perm = None
+    for perm in SYMMETRIES:
+        code = encode_cells([cells[k] for k in perm])
+        if best_code is None or code < best_code:
+            best_code = code
+            best_perm = perm
+    return best_code, best_perm
+
+def _cells_winner(cells):
+    for a, b, c in WIN_LINES:
+        if cells[a] != 0 and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return 0
+
+def _solve(cells):
+    """Move scores for the side to move (1) in canonical cells, memoized in the table"""
+    code, perm = canonical_form(cells)
+    if code in _perfect_play_table:
+        canon = _perfect_play_table[code]
+    else:
+        canon_cells = tuple(cells[k] for k in perm)
+        scores = []
+        for k in range(9):
+            if canon_cells[k] != 0:
+                scores.append(None)
+                continue
+            child = list(canon_cells)
+            child[k] = 1
+            if _cells_winner(child) == 1:
+                scores.append(10)
+            elif 0 not in child:
+                scores.append(0)
+            else:
+                # Opponent to move: swap perspective, then shift one ply deeper
+                reply = max(s for s in _solve(tuple((3 - v) % 3 for v in child)) if s is not None)
+                if reply > 0:
+                    scores.append(-(reply - 1))
+                elif reply < 0:
+                    scores.append(-(reply + 1))
+                else:
+                    scores.append(0)
+        canon = tuple(scores)
+        _perfect_play_table[code] = canon
+    # Map canonical scores back onto the original orientation
+    real = [None] * 9
+    for k in range(9):
+        real[perm[k]] = canon[k]
+    return tuple(real)
+
+def solve_game():
+    """Solve every reachable position once; returns a read-only view of the table"""
+    global _solved_table
+    if _solved_table is None:
+        from types import MappingProxyType
+        empty = (0,) * 9
+        # Side to move goes first ...
+        _solve(empty)
+        # ... or second, after any opening move by the other side
+        for k in range(9):
+            opened = [0] * 9
+            opened[k] = 2
+            _solve(tuple(opened))
+        _solved_table = MappingProxyType(dict(_perfect_play_table))
+    return _solved_table
+
+def move_scores(board, player, opponent):
+    """
+    Look up the minimax score of every cell for player
+    Returns a 3x3 list of scores (None for occupied cells),
+    or None if the game is already over
+    """
+    if check_winner(board) is not None or is_board_full(board):
+        return None
+    solve_game()
+    scores = _solve(board_to_cells(board, player, opponent))
+    return [list(scores[i * 3:i * 3 + 3]) for i in range(3)]
+
+def find_best_move(board, player, opponent):
+    """
+    Find the best move for the AI player by perfect-play table lookup
+    Returns tuple (row, col) of best move
+    """
+    if check_winner(board) is not None or is_board_full(board):
+        # Finished games are not in the table
+        return search_best_move(board, player, opponent)
+    solve_game()
+    scores = _solve(board_to_cells(board, player, opponent))
+    best_score = float('-inf')
+    best_move = None
+    for k in range(9):
+        if scores[k] is not None and scores[k] > best_score:
+            best_score = scores[k]
+            best_move = (k // 3, k % 3)
+    return best_move
+
 def print_board(board):
     """Print the board in a readable format"""
     print("\n  0   1   2")
@@ -179,9 +499,148 @@ def get_user_move(board):
             print("\nGame ended by user")
             exit()
 
+# Exhaustive sweep
+# Every legal position with a move to make (X moves first), run through a
+# solver in a process pool and checked against the original list-board
+# minimax as the reference oracle. Positions travel as 9-character strings.
+SWEEP_SOLVERS = ('table', 'bits', 'search')
+
+def enumerate_positions():
+    """All 4,520 reachable positions with a move left, as (cells, to_move)"""
+    positions = []
+    seen = set()
+    board = [[' ' for _ in range(3)] for _ in range(3)]
+
+    def visit(turn):
+        cells = ''.join(board[i][j] for i in range(3) for j in range(3))
+        if cells in seen:
+            return
+        seen.add(cells)
+        if check_winner(board) is not None or is_board_full(board):
+            return
+        positions.append((cells, turn))
+        for i, j in get_empty_cells(board):
+            board[i][j] = turn
+            visit('O' if turn == 'X' else 'X')
+            board[i][j] = ' '
+
+    visit('X')
+    return positions
+
+def _cells_to_board(cells):
+    return [list(cells[i * 3:i * 3 + 3]) for i in range(3)]
+
+def _sweep_solve(job):
+    """Pool worker: best move from the named solver for each position"""
+    solver, chunk = job
+    moves = []
+    for cells, turn in chunk:
+        opponent = 'O' if turn == 'X' else 'X'
+        board = _cells_to_board(cells)
+        if solver == 'table':
+            moves.append(find_best_move(board, turn, opponent))
+        elif solver == 'bits':
+            moves.append(search_best_move(BitBoard.from_board(board), turn, opponent))
+        else:
+            moves.append(search_best_move(board, turn, opponent))
+    return moves
+
+def _sweep_oracle(chunk):
+    """Pool worker: reference minimax score of every empty cell"""
+    results = []
+    for cells, turn in chunk:
+        opponent = 'O' if turn == 'X' else 'X'
+        board = _cells_to_board(cells)
+        scores = {}
+        for i, j in get_empty_cells(board):
+            board[i][j] = turn
+            scores[(i, j)] = minimax(board, 0, False, turn, opponent)
+            board[i][j] = ' '
+        results.append(scores)
+    return results
+
+def _chunks(items, count):
+    size = max(1, -(-len(items) // count))
+    return [items[k:k + size] for k in range(0, len(items), size)]
+
+def run_sweep(solver='table', workers=None, check=True):
+    """
+    Solve every legal position with solver ('table', 'bits' or 'search')
+    across a process pool; with check=True verify each move is optimal
+    according to the reference minimax. Returns a dict of results.
+    """
+    import os
+    import time
+    from multiprocessing import Pool
+
+    if solver not in SWEEP_SOLVERS:
+        raise ValueError(f"unknown solver {solver!r}, expected one of {SWEEP_SOLVERS}")
+    workers = workers or os.cpu_count() or 1
+    positions = enumerate_positions()
+    # Several chunks per worker so the slow early-game positions spread out
+    chunks = _chunks(positions, workers * 8)
+
+    with Pool(workers) as pool:
+        start = time.perf_counter()
+        moves = [m for part in pool.map(_sweep_solve, [(solver, c) for c in chunks]) for m in part]
+        solve_time = time.perf_counter() - start
+
+        result = {
+            'solver': solver,
+            'workers': workers,
+            'positions': len(positions),
+            'solve_seconds': solve_time,
+            'positions_per_sec': len(positions) / solve_time if solve_time else float('inf'),
+        }
+        if check:
+            start = time.perf_counter()
+            oracle = [s for part in pool.map(_sweep_oracle, chunks) for s in part]
+            result['oracle_seconds'] = time.perf_counter() - start
+
+            failures = []
+            identical = 0
+            for (cells, turn), move, scores in zip(positions, moves, oracle):
+                best = max(scores.values())
+                # The reference move is the first optimal cell in row-major order
+                reference = min(cell for cell, score in scores.items() if score == best)
+                if move == reference:
+                    identical += 1
+                if move not in scores or scores[move] != best:
+                    failures.append((cells, turn, move, reference))
+            result['optimal'] = len(positions) - len(failures)
+            result['identical'] = identical
+            result['failures'] = failures
+    return result
+
+def print_sweep(result):
+    """Print a run_sweep() report"""
+    print(f"Sweep: {result['positions']} positions, solver={result['solver']}, "
+          f"workers={result['workers']}")
+    print(f"  solve:  {result['solve_seconds']:.3f}s wall, "
+          f"{result['positions_per_sec']:,.0f} positions/sec")
+    if 'oracle_seconds' in result:
+        print(f"  oracle: {result['oracle_seconds']:.3f}s wall")
+        print(f"  optimal moves: {result['optimal']}/{result['positions']}, "
+              f"identical to reference: {result['identical']}/{result['positions']}")
+        for cells, turn, move, reference in result['failures'][:10]:
+            print(f"  FAIL {cells!r} {turn} to move: played {move}, reference {reference}")
+
 # Example usage
 if __name__ == "__main__":
     import random
+    import sys
+
+    # Batch mode: python X_O_game.py --sweep [--solver table|bits|search] [--workers N] [--no-check]
+    if '--sweep' in sys.argv:
+        solver = 'table'
+        workers = None
+        if '--solver' in sys.argv:
+            solver = sys.argv[sys.argv.index('--solver') + 1]
+        if '--workers' in sys.argv:
+            workers = int(sys.argv[sys.argv.index('--workers') + 1])
+        result = run_sweep(solver, workers, check='--no-check' not in sys.argv)
+        print_sweep(result)
+        sys.exit(1 if result.get('failures') else 0)
    
     # Initialize random board
     board = initialize_random_board()
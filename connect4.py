@@ -7,6 +7,7 @@ Connect Four with Minimax + Alpha-Beta pruning (Python)
 Usage:
   python3 connect4.py        # interactive human vs AI
   python3 connect4.py --test # automated AI vs random test (no input)
+  python3 connect4.py --cache [PATH]  # reuse searched positions across runs
 
 AI uses alpha-beta pruning minimax with a simple heuristic.
 """
@@ -14,6 +15,8 @@ import random
 import sys
 import time
 
+from position_cache import PositionCache, DEFAULT_PATH, cached_search
+
 ROWS = 8
 COLS = 8
 PLAYER = 1
@@ -190,7 +193,7 @@ def minimax(board, depth, alpha, beta, maximizingPlayer):
         return column, value
 
 # Simple interactive game
-def play_game(depth=4):
+def play_game(depth=4, cache=None):
     board = create_board()
     game_over = False
     turn = random.choice([PLAYER, AI])
@@ -220,7 +223,8 @@ def play_game(depth=4):
             turn = AI
         else:
             print('AI is thinking...')
-            col, minimax_score = minimax(board, depth, -float('inf'), float('inf'), True)
+            col, minimax_score = cached_search(cache, board, depth,
+                lambda: minimax(board, depth, -float('inf'), float('inf'), True))
             if col is None:
                 col = random.choice(get_valid_locations(board))
             row = get_next_open_row(board, col)
@@ -237,7 +241,7 @@ def play_game(depth=4):
             game_over = True
 
 # Automated test: AI vs random for a few games
-def automated_test(games=3, depth=4):
+def automated_test(games=3, depth=4, cache=None):
     print(f'Running automated test: AI(depth={depth}) vs Random — {games} games')
     results = {"AI":0, "Random":0, "Draw":0}
     for g in range(games):
@@ -262,7 +266,8 @@ def automated_test(games=3, depth=4):
                 if not valid:
                     results['Draw'] += 1
                     break
-                col, score = minimax(board, depth, -float('inf'), float('inf'), True)
+                col, score = cached_search(cache, board, depth,
+                    lambda: minimax(board, depth, -float('inf'), float('inf'), True))
                 if col is None:
                     col = random.choice(get_valid_locations(board))
                 row = get_next_open_row(board, col)
@@ -276,11 +281,23 @@ def automated_test(games=3, depth=4):
     return results
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1 and sys.argv[1] == '--test':
-        # run quick automated test
-        automated_test(games=5, depth=4)
-    else:
-        try:
-            play_game(depth=4)
-        except KeyboardInterrupt:
-            print('\nExiting.')
+    cache = None
+    if '--cache' in sys.argv:
+        idx = sys.argv.index('--cache')
+        path = DEFAULT_PATH
+        if idx + 1 < len(sys.argv) and not sys.argv[idx+1].startswith('--'):
+            path = sys.argv[idx+1]
+        cache = PositionCache(path)
+    try:
+        if '--test' in sys.argv:
+            # run quick automated test
+            automated_test(games=5, depth=4, cache=cache)
+        else:
+            try:
+                play_game(depth=4, cache=cache)
+            except KeyboardInterrupt:
+                print('\nExiting.')
+    finally:
+        if cache is not None:
+            print(f'Position cache: {cache.hits} hits, {cache.misses} misses, {len(cache)} entries')
+            cache.close()
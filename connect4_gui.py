@@ -6,6 +6,7 @@ Connect Four GUI using Pygame with Minimax + Alpha-Beta pruning AI
 - Command line options:
     python3 connect4_gui.py         # play against AI (default depth=4)
     python3 connect4_gui.py --depth 5  # set AI search depth
+    python3 connect4_gui.py --cache [PATH]  # reuse searched positions across runs
 
 Install dependency:
     pip install -r requirements.txt
@@ -17,6 +18,8 @@ import random
 import pygame
 import time
 
+from position_cache import PositionCache, DEFAULT_PATH, cached_search
+
 # Game settings
 ROWS = 8
 COLS = 8
@@ -204,7 +207,7 @@ def draw_board(screen, board):
                 pygame.draw.circle(screen, YELLOW, (x, y), RADIUS)
     pygame.display.update()
 
-def main(depth=4):
+def main(depth=4, cache=None):
     pygame.init()
     screen = pygame.display.set_mode(SIZE)
     pygame.display.set_caption('Connect Four - Minimax AI')
@@ -261,7 +264,8 @@ def main(depth=4):
         if not game_over and turn == AI:
             # AI move
             start = time.time()
-            col, score = minimax(board, depth, -math.inf, math.inf, True)
+            col, score = cached_search(cache, board, depth,
+                lambda: minimax(board, depth, -math.inf, math.inf, True))
             if col is None:
                 valid = get_valid_locations(board)
                 if not valid:
@@ -299,4 +303,16 @@ if __name__ == '__main__':
             depth = int(sys.argv[idx+1])
         except Exception:
             pass
-    main(depth=depth)
+    cache = None
+    if '--cache' in sys.argv:
+        idx = sys.argv.index('--cache')
+        path = DEFAULT_PATH
+        if idx + 1 < len(sys.argv) and not sys.argv[idx+1].startswith('--'):
+            path = sys.argv[idx+1]
+        cache = PositionCache(path)
+    try:
+        main(depth=depth, cache=cache)
+    finally:
+        if cache is not None:
+            print(f'Position cache: {cache.hits} hits, {cache.misses} misses, {len(cache)} entries')
+            cache.close()
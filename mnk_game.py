@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Generalized m,n,k tic-tac-toe (k in a row on an m x n board)
+- Negamax with alpha-beta pruning and a Zobrist-hashed transposition table
+- Move ordering: transposition-table move first, then cells ranked by the
+  lines they extend or block; only cells near existing stones are searched
+  on boards larger than 4x4
+- Iterative deepening with an optional depth and time limit; unfinished
+  lines are scored by a heuristic at the leaves
+
+Usage:
+  python3 mnk_game.py                          # 3x3, k=3, human vs AI
+  python3 mnk_game.py --rows 7 --cols 7 --k 5  # 7x7 gomoku-style
+  python3 mnk_game.py --time 2 --depth 6       # per-move limits for the AI
+  python3 mnk_game.py --test                   # automated AI vs random test
+
+Boards use the same layout as X_O_game.py: a list of rows holding
+'X', 'O' or ' '.
+"""
+import random
+import sys
+import time
+
+EMPTY = 0
+WIN_SCORE = 10 ** 9
+WIN_THRESHOLD = WIN_SCORE - 10 ** 6  # anything above is a forced win
+EXACT, LOWER, UPPER = 0, 1, 2
+TIME_CHECK_NODES = 1024  # nodes between clock checks
+
+class SearchTimeout(Exception):
+    pass
+
+class MNKEngine:
+    def __init__(self, rows=3, cols=3, k=3, radius=1, tt_size=1 << 20, seed=0):
+        """
+        rows, cols, k: board size and line length needed to win
+        radius: only search empty cells within this distance of a stone
+                (ignored on boards of 16 cells or fewer, where all are tried)
+        tt_size: maximum transposition table entries before it is cleared
+        """
+        if k > max(rows, cols):
+            raise ValueError(f"k={k} does not fit on a {rows}x{cols} board")
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.size = rows * cols
+        self.radius = None if self.size <= 16 else radius
+        self.tt_size = tt_size
+        self.tt = {}
+        self.nodes = 0
+        self.deadline = None
+
+        # Every line of k cells, and for each cell the lines through it
+        self.windows = self._build_windows()
+        self.cell_windows = [[] for _ in range(self.size)]
+        for w, cells in enumerate(self.windows):
+            for idx in cells:
+                self.cell_windows[idx].append(w)
+        self.neighbours = self._build_neighbours()
+        # Heuristic weight of a line holding c stones of one side only
+        self.weights = [0] + [4 ** c for c in range(1, k + 1)]
+        # Static preference for central cells, used as an ordering tiebreak
+        ci, cj = (rows - 1) / 2, (cols - 1) / 2
+        self.centrality = [-(abs(i - ci) + abs(j - cj)) for i in range(rows) for j in range(cols)]
+
+        rng = random.Random(seed)
+        self.zobrist = [[0, rng.getrandbits(64), rng.getrandbits(64)] for _ in range(self.size)]
+        self.zobrist_side = rng.getrandbits(64)
+
+        # Search state, loaded from a board by find_best_move
+        self.cells = [EMPTY] * self.size
+        self.counts = [[0, 0, 0] for _ in self.windows]
+        self.stones = 0
+        self.hash = 0
+
+    def _build_windows(self):
+        windows = []
+        directions = ((0, 1), (1, 0), (1, 1), (1, -1))
+        for i in range(self.rows):
+            for j in range(self.cols):
+                for di, dj in directions:
+                    ei, ej = i + di * (self.k - 1), j + dj * (self.k - 1)
+                    if 0 <= ei < self.rows and 0 <= ej < self.cols:
+                        windows.append(tuple((i + di * s) * self.cols + (j + dj * s)
+                                             for s in range(self.k)))
+        return windows
+
+    def _build_neighbours(self):
+        if self.radius is None:
+            return None
+        neighbours = []
+        for i in range(self.rows):
+            for j in range(self.cols):
+                near = []
+                for ni in range(max(0, i - self.radius), min(self.rows, i + self.radius + 1)):
+                    for nj in range(max(0, j - self.radius), min(self.cols, j + self.radius + 1)):
+                        if (ni, nj) != (i, j):
+                            near.append(ni * self.cols + nj)
+                neighbours.append(near)
+        return neighbours
+
+    # Board state
+    def load(self, board, player, opponent):
+        """Load a list-of-rows board; player becomes side 1 (to move)"""
+        self.cells = [EMPTY] * self.size
+        self.counts = [[0, 0, 0] for _ in self.windows]
+        self.stones = 0
+        self.hash = 0
+        for i in range(self.rows):
+            for j in range(self.cols):
+                v = board[i][j]
+                if v == player:
+                    self.place(i * self.cols + j, 1)
+                elif v == opponent:
+                    self.place(i * self.cols + j, 2)
+        # place() toggles the side key each move; normalise to side 1 to move
+        self.hash ^= self.zobrist_side * (self.stones & 1)
+
+    def place(self, idx, side):
+        self.cells[idx] = side
+        self.stones += 1
+        self.hash ^= self.zobrist[idx][side] ^ self.zobrist_side
+        for w in self.cell_windows[idx]:
+            self.counts[w][side] += 1
+
+    def undo(self, idx, side):
+        self.cells[idx] = EMPTY
+        self.stones -= 1
+        self.hash ^= self.zobrist[idx][side] ^ self.zobrist_side
+        for w in self.cell_windows[idx]:
+            self.counts[w][side] -= 1
+
+    def is_win_at(self, idx, side):
+        """True if the stone just placed at idx completed a line for side"""
+        k = self.k
+        for w in self.cell_windows[idx]:
+            if self.counts[w][side] == k:
+                return True
+        return False
+
+    def evaluate(self, side):
+        """Heuristic score of the position for side"""
+        weights = self.weights
+        other = 3 - side
+        score = 0
+        for c in self.counts:
+            if c[other] == 0:
+                score += weights[c[side]]
+            elif c[side] == 0:
+                score -= weights[c[other]]
+        return score
+
+    def ordered_moves(self, side, tt_move):
+        """Candidate cells, most promising first"""
+        cells = self.cells
+        if self.neighbours is None or self.stones == 0:
+            candidates = [idx for idx in range(self.size) if cells[idx] == EMPTY]
+        else:
+            seen = set()
+            for idx in range(self.size):
+                if cells[idx] != EMPTY:
+                    for n in self.neighbours[idx]:
+                        if cells[n] == EMPTY:
+                            seen.add(n)
+            candidates = list(seen)
+        other = 3 - side
+        weights = self.weights
+        counts = self.counts
+        k = self.k
+
+        def priority(idx):
+            # Lines this cell extends for us plus lines it blocks for them
+            score = 0
+            for w in self.cell_windows[idx]:
+                c = counts[w]
+                if c[other] == 0:
+                    score += WIN_SCORE if c[side] == k - 1 else weights[c[side]] * 2
+                elif c[side] == 0:
+                    score += WIN_SCORE // 2 if c[other] == k - 1 else weights[c[other]]
+            return (score, self.centrality[idx])
+
+        candidates.sort(key=priority, reverse=True)
+        if tt_move is not None and tt_move in candidates:
+            candidates.remove(tt_move)
+            candidates.insert(0, tt_move)
+        return candidates
+
+    # Search
+    def _negamax(self, depth, alpha, beta, ply, side):
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % TIME_CHECK_NODES == 0 \
+                and time.time() > self.deadline:
+            raise SearchTimeout()
+
+        alpha_orig = alpha
+        tt_move = None
+        entry = self.tt.get(self.hash)
+        if entry is not None:
+            e_depth, e_value, e_flag, tt_move = entry
+            if e_depth >= depth:
+                # Win scores are stored relative to this node, not the root
+                if e_value > WIN_THRESHOLD:
+                    e_value -= ply
+                elif e_value < -WIN_THRESHOLD:
+                    e_value += ply
+                if e_flag == EXACT:
+                    return e_value
+                if e_flag == LOWER:
+                    alpha = max(alpha, e_value)
+                else:
+                    beta = min(beta, e_value)
+                if alpha >= beta:
+                    return e_value
+
+        if depth == 0:
+            return self.evaluate(side)
+
+        moves = self.ordered_moves(side, tt_move)
+        if not moves:
+            return 0
+
+        best_value = -WIN_SCORE - 1
+        best_move = moves[0]
+        for idx in moves:
+            self.place(idx, side)
+            if self.is_win_at(idx, side):
+                value = WIN_SCORE - ply
+            elif self.stones == self.size:
+                value = 0
+            else:
+                value = -self._negamax(depth - 1, -beta, -alpha, ply + 1, 3 - side)
+            self.undo(idx, side)
+            if value > best_value:
+                best_value = value
+                best_move = idx
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        stored = best_value
+        if stored > WIN_THRESHOLD:
+            stored += ply
+        elif stored < -WIN_THRESHOLD:
+            stored -= ply
+        if len(self.tt) >= self.tt_size:
+            self.tt.clear()
+        self.tt[self.hash] = (depth, stored, flag, best_move)
+        return best_value
+
+    def _search_root(self, depth):
+        """One full-width alpha-beta pass; returns (best idx, score)"""
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        entry = self.tt.get(self.hash)
+        moves = self.ordered_moves(1, entry[3] if entry else None)
+        best_move, best_value = moves[0], -WIN_SCORE - 1
+        for idx in moves:
+            self.place(idx, 1)
+            if self.is_win_at(idx, 1):
+                value = WIN_SCORE
+            elif self.stones == self.size:
+                value = 0
+            else:
+                value = -self._negamax(depth - 1, -beta, -alpha, 1, 2)
+            self.undo(idx, 1)
+            if value > best_value:
+                best_value, best_move = value, idx
+            alpha = max(alpha, value)
+        self.tt[self.hash] = (depth, best_value, EXACT, best_move)
+        return best_move, best_value
+
+    def find_best_move(self, board, player, opponent, max_depth=None, time_limit=None):
+        """
+        Find the best move for player by iterative deepening
+        max_depth: plies to search (default: until the board is full)
+        time_limit: seconds; the deepest completed iteration is used
+        Returns tuple (row, col), or None if the board is full
+        """
+        self.load(board, player, opponent)
+        empty = self.size - self.stones
+        if empty == 0:
+            return None
+        limit = empty if max_depth is None else min(max_depth, empty)
+        self.nodes = 0
+        self.deadline = None if time_limit is None else time.time() + time_limit
+        best_move = None
+        try:
+            for depth in range(1, limit + 1):
+                # Restore a clean board in case a timeout interrupted a pass
+                self.load(board, player, opponent)
+                best_move, value = self._search_root(depth)
+                if WIN_SCORE - abs(value) < depth:
+                    # Forced result inside the search horizon; deeper won't change it
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+        if best_move is None:
+            # Timed out before depth 1 finished; fall back to move ordering
+            self.load(board, player, opponent)
+            best_move = self.ordered_moves(1, None)[0]
+        return (best_move // self.cols, best_move % self.cols)
+
+# Board helpers
+def create_board(rows, cols):
+    return [[' ' for _ in range(cols)] for _ in range(rows)]
+
+def check_winner(board, k):
+    """Return 'X' or 'O' if either has k in a row, else None"""
+    rows, cols = len(board), len(board[0])
+    for i in range(rows):
+        for j in range(cols):
+            v = board[i][j]
+            if v == ' ':
+                continue
+            for di, dj in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                ei, ej = i + di * (k - 1), j + dj * (k - 1)
+                if 0 <= ei < rows and 0 <= ej < cols and \
+                        all(board[i + di * s][j + dj * s] == v for s in range(k)):
+                    return v
+    return None
+
+def is_board_full(board):
+    return all(v != ' ' for row in board for v in row)
+
+def print_board(board):
+    cols = len(board[0])
+    print("\n     " + "   ".join(str(j % 10) for j in range(cols)))
+    for i, row in enumerate(board):
+        print(f"{i:>3}  " + " | ".join(row))
+    print()
+
+def play_game(rows=3, cols=3, k=3, depth=None, time_limit=None):
+    engine = MNKEngine(rows, cols, k)
+    board = create_board(rows, cols)
+    user_turn = random.choice([True, False])
+    print(f"{rows}x{cols}, {k} in a row. You are X, AI is O. {'You' if user_turn else 'AI'} go first.")
+    print_board(board)
+    while True:
+        winner = check_winner(board, k)
+        if winner:
+            print(f"{winner} wins!")
+            break
+        if is_board_full(board):
+            print("It's a draw!")
+            break
+        if user_turn:
+            while True:
+                try:
+                    row, col = map(int, input("Enter your move (row col): ").split())
+                    if 0 <= row < rows and 0 <= col < cols and board[row][col] == ' ':
+                        break
+                    print("Invalid move")
+                except ValueError:
+                    print("Please enter row and column separated by space")
+            board[row][col] = 'X'
+        else:
+            print("AI is thinking...")
+            start = time.time()
+            row, col = engine.find_best_move(board, 'O', 'X', max_depth=depth, time_limit=time_limit)
+            board[row][col] = 'O'
+            print(f"AI plays at {(row, col)} ({engine.nodes} nodes, {time.time() - start:.2f}s)")
+        print_board(board)
+        user_turn = not user_turn
+
+def automated_test(games=3, rows=3, cols=3, k=3, depth=None, time_limit=None):
+    print(f'Running automated test: AI vs Random on {rows}x{cols}, k={k} — {games} games')
+    engine = MNKEngine(rows, cols, k)
+    results = {"AI": 0, "Random": 0, "Draw": 0}
+    for g in range(games):
+        board = create_board(rows, cols)
+        ai_turn = random.choice([True, False])
+        while True:
+            if ai_turn:
+                row, col = engine.find_best_move(board, 'O', 'X', max_depth=depth, time_limit=time_limit)
+                board[row][col] = 'O'
+            else:
+                row, col = random.choice([(i, j) for i in range(rows) for j in range(cols)
+                                          if board[i][j] == ' '])
+                board[row][col] = 'X'
+            winner = check_winner(board, k)
+            if winner:
+                results['AI' if winner == 'O' else 'Random'] += 1
+                break
+            if is_board_full(board):
+                results['Draw'] += 1
+                break
+            ai_turn = not ai_turn
+        print(f'Game {g+1}/{games} finished — current tally: {results}')
+    print('Automated test complete.')
+    return results
+
+def _arg(name, default, cast=int):
+    if name in sys.argv:
+        try:
+            return cast(sys.argv[sys.argv.index(name) + 1])
+        except (IndexError, ValueError):
+            pass
+    return default
+
+if __name__ == '__main__':
+    rows = _arg('--rows', 3)
+    cols = _arg('--cols', rows)
+    k = _arg('--k', min(rows, cols))
+    depth = _arg('--depth', None)
+    time_limit = _arg('--time', None if rows * cols <= 9 else 2.0, float)
+    if '--test' in sys.argv:
+        automated_test(games=5, rows=rows, cols=cols, k=k, depth=depth, time_limit=time_limit)
+    else:
+        try:
+            play_game(rows, cols, k, depth=depth, time_limit=time_limit)
+        except KeyboardInterrupt:
+            print('\nExiting.')
@@ -0,0 +1,198 @@
+# Modular Exponentiation Engines
+# Interchangeable implementations of (base^exp) % mod:
+#   binary      right-to-left square-and-multiply (same as rsa_encryption.mod_pow)
+#   fixed       fixed-window (k-ary): k exponent bits per multiplication
+#   sliding     sliding-window: windows start and end on a 1 bit, so only
+#               the odd powers base^1, base^3, ..., base^(2^k - 1) are needed
+#   montgomery  sliding-window with Montgomery multiplication (odd moduli),
+#               which replaces every division by masks and shifts
+#   builtin     Python's three-argument pow
+#
+# Work that depends only on the exponent (window recoding) or only on the
+# modulus (Montgomery constants) is cached, so encrypting many blocks with
+# the same key pays for it once.
+
+from functools import lru_cache
+
+# Right-to-left square-and-multiply
+def binary_pow(base, exp, mod):
+    if exp < 0:
+        raise ValueError("negative exponent")
+    result = 1 % mod
+    base = base % mod
+    while exp > 0:
+        if exp & 1:
+            result = (result * base) % mod
+        exp >>= 1
+        base = (base * base) % mod
+    return result
+
+# Window size that minimises multiplications for an exponent of this length
+def window_size(bits):
+    for k, limit in ((1, 24), (3, 80), (4, 240), (5, 672), (6, 1792)):
+        if bits <= limit:
+            return k
+    return 7
+
+# exp split MSB-first into k-bit digits
+@lru_cache(maxsize=256)
+def fixed_window_digits(exp, k):
+    digits = []
+    mask = (1 << k) - 1
+    while exp:
+        digits.append(exp & mask)
+        exp >>= k
+    return tuple(reversed(digits))
+
+# exp recoded MSB-first into (squarings, odd digit) steps: square the
+# accumulator `squarings` times, then multiply by base^digit (digit 0 = none)
+@lru_cache(maxsize=256)
+def sliding_window_plan(exp, k):
+    bits = bin(exp)[2:]
+    steps = []
+    squarings = 0
+    i = 0
+    while i < len(bits):
+        if bits[i] == '0':
+            squarings += 1
+            i += 1
+            continue
+        j = min(i + k, len(bits))
+        while bits[j - 1] == '0':
+            j -= 1
+        steps.append((squarings + (j - i), int(bits[i:j], 2)))
+        squarings = 0
+        i = j
+    if squarings:
+        steps.append((squarings, 0))
+    return tuple(steps)
+
+# base^1, base^3, ..., base^(2^k - 1), indexed by exponent (even slots unused)
+def _odd_powers(base, k, mul):
+    table = [None] * (1 << k)
+    table[1] = base
+    if k > 1:
+        square = mul(base, base)
+        for i in range(3, 1 << k, 2):
+            table[i] = mul(table[i - 2], square)
+    return table
+
+# Evaluate a sliding-window plan with the given multiplication
+def _run_plan(plan, table, mul):
+    # The first step starts from base^digit instead of squaring 1
+    _, digit = plan[0]
+    result = table[digit]
+    for squarings, digit in plan[1:]:
+        for _ in range(squarings):
+            result = mul(result, result)
+        if digit:
+            result = mul(result, table[digit])
+    return result
+
+# Fixed-window (k-ary) exponentiation
+def fixed_window_pow(base, exp, mod, k=None):
+    if exp < 0:
+        raise ValueError("negative exponent")
+    if exp == 0:
+        return 1 % mod
+    k = k or window_size(exp.bit_length())
+    base = base % mod
+    table = [1 % mod] * (1 << k)
+    for i in range(1, 1 << k):
+        table[i] = (table[i - 1] * base) % mod
+    result = 1 % mod
+    for digit in fixed_window_digits(exp, k):
+        for _ in range(k):
+            result = (result * result) % mod
+        if digit:
+            result = (result * table[digit]) % mod
+    return result
+
+# Sliding-window exponentiation with precomputed odd powers
+def sliding_window_pow(base, exp, mod, k=None):
+    if exp < 0:
+        raise ValueError("negative exponent")
+    if exp == 0:
+        return 1 % mod
+    k = k or window_size(exp.bit_length())
+    base = base % mod
+    table = [None] * (1 << k)
+    table[1] = base
+    if k > 1:
+        square = (base * base) % mod
+        for i in range(3, 1 << k, 2):
+            table[i] = (table[i - 2] * square) % mod
+    # Same loop as _run_plan, with the reduction inlined
+    plan = sliding_window_plan(exp, k)
+    result = table[plan[0][1]]
+    for squarings, digit in plan[1:]:
+        for _ in range(squarings):
+            result = (result * result) % mod
+        if digit:
+            result = (result * table[digit]) % mod
+    return result
+
+# Montgomery arithmetic for one odd modulus: values are kept as a * R mod n
+# with R = 2^bits, and a * b * R^-1 mod n is computed without dividing by n
+class Montgomery:
+    def __init__(self, mod):
+        if mod < 3 or mod % 2 == 0:
+            raise ValueError("Montgomery form needs an odd modulus > 2")
+        self.mod = mod
+        self.bits = mod.bit_length()
+        self.mask = (1 << self.bits) - 1
+        self.n_prime = -pow(mod, -1, 1 << self.bits) & self.mask
+        self.mul = self._make_mul()
+
+    def to_mont(self, a):
+        return (a << self.bits) % self.mod
+
+    def reduce(self, t):
+        """REDC: t * R^-1 mod n for 0 <= t < n * R"""
+        m = ((t & self.mask) * self.n_prime) & self.mask
+        u = (t + m * self.mod) >> self.bits
+        return u - self.mod if u >= self.mod else u
+
+    # a * b * R^-1 mod n as a closure over the constants, since it runs in
+    # the inner loop of pow()
+    def _make_mul(self):
+        mod, bits, mask, n_prime = self.mod, self.bits, self.mask, self.n_prime
+
+        def mul(a, b):
+            t = a * b
+            u = (t + (((t & mask) * n_prime) & mask) * mod) >> bits
+            return u - mod if u >= mod else u
+        return mul
+
+    def pow(self, base, exp, k=None):
+        if exp < 0:
+            raise ValueError("negative exponent")
+        if exp == 0:
+            return 1
+        k = k or window_size(exp.bit_length())
+        table = _odd_powers(self.to_mont(base % self.mod), k, self.mul)
+        return self.reduce(_run_plan(sliding_window_plan(exp, k), table, self.mul))
+
+@lru_cache(maxsize=64)
+def montgomery_context(mod):
+    return Montgomery(mod)
+
+# Montgomery exponentiation, falling back to sliding window for even moduli
+def montgomery_pow(base, exp, mod, k=None):
+    if mod < 3 or mod % 2 == 0:
+        return sliding_window_pow(base, exp, mod, k)
+    return montgomery_context(mod).pow(base, exp, k)
+
+ENGINES = {
+    'binary': binary_pow,
+    'fixed': fixed_window_pow,
+    'sliding': sliding_window_pow,
+    'montgomery': montgomery_pow,
+    'builtin': pow,
+}
+
+def get_engine(name):
+    """Return the pow(base, exp, mod) function registered under name"""
+    if name not in ENGINES:
+        raise ValueError(f"unknown engine {name!r}, expected one of {sorted(ENGINES)}")
+    return ENGINES[name]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk position cache for the Connect Four AI.
+- Maps (position, depth) -> (best move, score) in a local SQLite file
+- Shared safely between processes (WAL journal + busy timeout), so parallel
+  tournament workers can all read and write the same cache file
+- Bounded: least-recently-used entries are evicted past `max_entries` and
+  entries not touched for `max_age` seconds are dropped
+
+Usage:
+  cache = PositionCache('connect4_cache.sqlite3')
+  col, score = cached_search(cache, board, depth,
+                             lambda: minimax(board, depth, -inf, inf, True))
+
+Positions are always stored from the AI's side (maximizing player to move).
+A probe accepts any stored result searched at least as deep as requested.
+Only results searched to `min_depth` or deeper are written back, shallow
+searches are cheaper to redo than to store.
+"""
+import sqlite3
+import time
+
+DEFAULT_PATH = 'connect4_cache.sqlite3'
+DEFAULT_MAX_ENTRIES = 200000
+DEFAULT_MAX_AGE = 30 * 24 * 3600  # 30 days
+DEFAULT_MIN_DEPTH = 4
+EVICT_EVERY = 256  # stores between eviction sweeps
+
+def encode_board(board):
+    """Encode a board (list of rows of small ints) as a compact string key"""
+    return ''.join(''.join(str(v) for v in row) for row in board)
+
+class PositionCache:
+    def __init__(self, path=DEFAULT_PATH, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_age=DEFAULT_MAX_AGE, min_depth=DEFAULT_MIN_DEPTH, timeout=30.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.min_depth = min_depth
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+        # autocommit mode; write transactions are opened explicitly below
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS positions ('
+            ' position TEXT NOT NULL,'
+            ' depth INTEGER NOT NULL,'
+            ' move INTEGER,'
+            ' score INTEGER NOT NULL,'
+            ' last_used REAL NOT NULL,'
+            ' PRIMARY KEY (position, depth))'
+        )
+        self.conn.execute(
+            'CREATE INDEX IF NOT EXISTS positions_last_used ON positions (last_used)'
+        )
+
+    def probe(self, board, depth):
+        """Return (move, score) for board searched to >= depth, or None"""
+        key = encode_board(board)
+        now = time.time()
+        row = self.conn.execute(
+            'SELECT depth, move, score FROM positions'
+            ' WHERE position = ? AND depth >= ? AND last_used >= ?'
+            ' ORDER BY depth DESC LIMIT 1',
+            (key, depth, now - self.max_age),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            self.conn.execute(
+                'UPDATE positions SET last_used = ? WHERE position = ? AND depth = ?',
+                (now, key, row[0]),
+            )
+        except sqlite3.OperationalError:
+            # another worker holds the write lock; recency is best-effort
+            pass
+        return row[1], row[2]
+
+    def store(self, board, depth, move, score):
+        """Write back a search result if it is deep enough to be worth keeping"""
+        if depth < self.min_depth:
+            return
+        key = encode_board(board)
+        self._stores += 1
+        with self._write():
+            self.conn.execute(
+                'INSERT OR REPLACE INTO positions (position, depth, move, score, last_used)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (key, depth, move, int(score), time.time()),
+            )
+            if self._stores % EVICT_EVERY == 0:
+                self._evict()
+
+    def evict(self):
+        """Drop expired entries and trim the cache down to max_entries"""
+        with self._write():
+            self._evict()
+
+    def _evict(self):
+        self.conn.execute(
+            'DELETE FROM positions WHERE last_used < ?', (time.time() - self.max_age,)
+        )
+        count = self.conn.execute('SELECT COUNT(*) FROM positions').fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                'DELETE FROM positions WHERE rowid IN'
+                ' (SELECT rowid FROM positions ORDER BY last_used ASC LIMIT ?)',
+                (excess,),
+            )
+
+    def _write(self):
+        return _WriteTransaction(self.conn)
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM positions').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class _WriteTransaction:
+    """BEGIN IMMEDIATE ... COMMIT, so concurrent writers queue on the busy timeout"""
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute('COMMIT')
+        else:
+            self.conn.execute('ROLLBACK')
+        return False
+
+def cached_search(cache, board, depth, search):
+    """
+    Probe the cache before searching and write the result back afterwards.
+    search: zero-argument callable returning (move, score)
+    With cache=None this is just search().
+    """
+    if cache is None:
+        return search()
+    hit = cache.probe(board, depth)
+    if hit is not None:
+        return hit
+    move, score = search()
+    if move is not None:
+        cache.store(board, depth, move, score)
+    return move, score
@@ -0,0 +1,182 @@
+# RSA Benchmarks
+# Times mod_pow and every modexp.py engine against the builtin three-argument
+# pow, and end-to-end encryption/decryption throughput across message sizes
+# and key sizes for every codec path: lookup table (demo key), serial, CRT
+# decryption and the packed-bytes codec. All codec paths exponentiate with
+# rsa_encryption.ENGINE. Results are printed and written as JSON so runs can
+# be compared over time.
+#
+# Usage:
+#   python rsa_benchmark.py                       # default sizes, writes rsa_benchmark.json
+#   python rsa_benchmark.py --quick               # small sizes, a few seconds
+#   python rsa_benchmark.py --key-sizes 512,1024 --sizes 64,1024 --out run.json
+#   python rsa_benchmark.py --engine montgomery   # codec paths on another engine
+
+import json
+import platform
+import random
+import sys
+import time
+
+import modexp
+import rsa_encryption as rsa
+from rsa_keygen import generate_keypair
+
+DEFAULT_KEY_SIZES = (512, 1024, 2048)
+DEFAULT_MESSAGE_SIZES = (64, 1024, 4096)
+QUICK_KEY_SIZES = (512,)
+QUICK_MESSAGE_SIZES = (64, 512)
+MIN_TIME = 0.2  # seconds each measurement is repeated for
+
+# Average seconds per call, repeating func until min_time has passed
+def time_call(func, min_time=MIN_TIME):
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls
+
+# mod_pow and each engine vs builtin pow with the public and private exponent of key
+def bench_mod_pow(key, min_time=MIN_TIME):
+    rng = random.Random(0)
+    bases = [rng.randrange(2, key.n) for _ in range(16)]
+    results = []
+    for name, exp in (('e', key.e), ('d', key.d)):
+        ours = time_call(lambda: [rsa.mod_pow(b, exp, key.n) for b in bases], min_time) / len(bases)
+        builtin = time_call(lambda: [pow(b, exp, key.n) for b in bases], min_time) / len(bases)
+        engines = {}
+        for engine, power in modexp.ENGINES.items():
+            engines[engine] = time_call(lambda: [power(b, exp, key.n) for b in bases], min_time) / len(bases) * 1e6
+        results.append({
+            'key_bits': key.n.bit_length(),
+            'exponent': name,
+            'mod_pow_us': ours * 1e6,
+            'builtin_pow_us': builtin * 1e6,
+            'slowdown': ours / builtin,
+            'engines_us': engines,
+        })
+    return results
+
+# The (path, op, function, block count) cases available for key and message
+def codec_cases(key, message):
+    data = message.encode('ascii')
+    blocks = rsa.encrypt_blocks(message, key)
+    values = rsa.message_to_blocks(message)
+    values = values.tolist() if hasattr(values, 'tolist') else values
+    packed = rsa.encrypt_packed(data, key)
+    cases = []
+    if key.n <= rsa.TABLE_MAX_MODULUS:
+        rsa.get_tables(key.n, key.e)  # build outside the timed region
+        cases.append(('table', 'encrypt', lambda: rsa.encrypt_blocks(message, key), len(blocks)))
+        cases.append(('table', 'decrypt', lambda: rsa.decrypt_blocks(blocks, key), len(blocks)))
+        # The exponentiation paths, bypassing the tables
+        power = modexp.get_engine(rsa.ENGINE)
+        cases.append(('serial', 'encrypt', lambda: [power(m, key.e, key.n) for m in values], len(blocks)))
+        cases.append(('serial', 'decrypt', lambda: [rsa.decrypt_block(c, key, crt=False) for c in blocks], len(blocks)))
+        cases.append(('crt', 'decrypt', lambda: [rsa.decrypt_block(c, key) for c in blocks], len(blocks)))
+    else:
+        cases.append(('serial', 'encrypt', lambda: rsa.encrypt_blocks(message, key), len(blocks)))
+        cases.append(('serial', 'decrypt', lambda: rsa.decrypt_values(blocks, key, crt=False), len(blocks)))
+        cases.append(('crt', 'decrypt', lambda: rsa.decrypt_values(blocks, key), len(blocks)))
+    cases.append(('packed', 'encrypt', lambda: rsa.encrypt_packed(data, key), len(packed)))
+    cases.append(('packed', 'decrypt', lambda: rsa.decrypt_packed(packed, key), len(packed)))
+    return cases
+
+# Throughput of every codec path for one key and message size
+def bench_codec(key, message_size, min_time=MIN_TIME):
+    rng = random.Random(message_size)
+    message = ''.join(rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ ') for _ in range(message_size))
+    results = []
+    for path, op, func, blocks in codec_cases(key, message):
+        seconds = time_call(func, min_time)
+        results.append({
+            'key_bits': key.n.bit_length(),
+            'path': path,
+            'op': op,
+            'message_bytes': message_size,
+            'blocks': blocks,
+            'seconds': seconds,
+            'blocks_per_sec': blocks / seconds,
+            'mb_per_sec': message_size / seconds / 1e6,
+        })
+    return results
+
+def run_benchmarks(key_sizes=DEFAULT_KEY_SIZES, message_sizes=DEFAULT_MESSAGE_SIZES,
+                   min_time=MIN_TIME, log=print):
+    """Run every benchmark; returns the JSON-ready results dict"""
+    keys = [rsa.DEFAULT_KEY]
+    for bits in key_sizes:
+        log(f"Generating {bits}-bit key...")
+        keys.append(generate_keypair(bits))
+
+    results = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': rsa.np is not None,
+            'min_time': min_time,
+            'engine': rsa.ENGINE,
+        },
+        'mod_pow': [],
+        'codec': [],
+    }
+    for key in keys:
+        log(f"Benchmarking {key.n.bit_length()}-bit key...")
+        results['mod_pow'].extend(bench_mod_pow(key, min_time))
+        for size in message_sizes:
+            results['codec'].extend(bench_codec(key, size, min_time))
+    return results
+
+def print_results(results):
+    print("\nmod_pow vs builtin pow (microseconds per call)")
+    print(f"{'bits':>6} {'exp':>4} {'mod_pow':>12} {'pow':>12} {'slowdown':>9}")
+    for r in results['mod_pow']:
+        print(f"{r['key_bits']:>6} {r['exponent']:>4} {r['mod_pow_us']:>12.1f} "
+              f"{r['builtin_pow_us']:>12.1f} {r['slowdown']:>8.1f}x")
+
+    print("\nExponentiation engines (microseconds per call)")
+    names = list(modexp.ENGINES)
+    print(f"{'bits':>6} {'exp':>4} " + ' '.join(f"{name:>11}" for name in names))
+    for r in results['mod_pow']:
+        print(f"{r['key_bits']:>6} {r['exponent']:>4} "
+              + ' '.join(f"{r['engines_us'][name]:>11.1f}" for name in names))
+
+    print(f"\nCodec throughput ({results['meta']['engine']} engine)")
+    print(f"{'bits':>6} {'path':>7} {'op':>8} {'bytes':>7} {'blocks':>7} {'blocks/s':>12} {'MB/s':>9}")
+    for r in results['codec']:
+        print(f"{r['key_bits']:>6} {r['path']:>7} {r['op']:>8} {r['message_bytes']:>7} {r['blocks']:>7} "
+              f"{r['blocks_per_sec']:>12,.0f} {r['mb_per_sec']:>9.4f}")
+
+def _sizes_arg(name, default):
+    if name not in sys.argv:
+        return default
+    try:
+        return tuple(int(v) for v in sys.argv[sys.argv.index(name) + 1].split(','))
+    except (IndexError, ValueError):
+        print(f"{name} takes a comma-separated list of integers")
+        sys.exit(2)
+
+if __name__ == "__main__":
+    quick = '--quick' in sys.argv
+    key_sizes = _sizes_arg('--key-sizes', QUICK_KEY_SIZES if quick else DEFAULT_KEY_SIZES)
+    message_sizes = _sizes_arg('--sizes', QUICK_MESSAGE_SIZES if quick else DEFAULT_MESSAGE_SIZES)
+    out_path = 'rsa_benchmark.json'
+    if '--engine' in sys.argv:
+        try:
+            rsa.set_engine(sys.argv[sys.argv.index('--engine') + 1])
+        except (IndexError, ValueError):
+            print(f"--engine takes one of {', '.join(modexp.ENGINES)}")
+            sys.exit(2)
+    if '--out' in sys.argv:
+        out_path = sys.argv[sys.argv.index('--out') + 1]
+
+    results = run_benchmarks(key_sizes, message_sizes, MIN_TIME / 4 if quick else MIN_TIME)
+    print_results(results)
+    with open(out_path, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+    print(f"\nResults written to {out_path}")
@@ -1,11 +1,46 @@
 # RSA Encryption and Decryption
 # Public Key (n, e) = (3233, 17)
 # Private Key (n, d) = (3233, 2753)
+# Other keys can be generated with rsa_keygen.py and passed as key=...
+
+import os
+import sys
+import time
+
+import modexp
+from rsa_keygen import PrivateKey, make_private_key, load_key
+
+try:
+    import numpy as np
+except ImportError:  # optional, only speeds up the bulk codec
+    np = None
 
 # RSA Parameters
-n = 3233
-e = 17  # Public exponent
-d = 2753  # Private exponent
+# The demo key n = 61 * 53, kept with its CRT parameters
+DEFAULT_KEY = make_private_key(61, 53, 17)
+n = DEFAULT_KEY.n  # 3233
+e = DEFAULT_KEY.e  # Public exponent 17
+d = DEFAULT_KEY.d  # Private exponent 2753
+
+# Moduli up to this size get full m->c / c->m lookup tables in the bulk codec
+TABLE_MAX_MODULUS = 1 << 16
+
+# Parallel mode (workers > 1): jobs whose estimated work (see _pow_work) is
+# below this stay serial, since starting a pool and pickling blocks costs
+# more than it saves. That is roughly 50-150ms of serial time: about 500
+# encryptions with e=65537 but only 14 CRT decryptions at 2048 bits.
+# Each worker gets a few large chunks to keep pickling overhead low.
+PARALLEL_MIN_WORK = 10_000_000
+CHUNKS_PER_WORKER = 4
+
+# Exponentiation engine (see modexp.py) used by the bulk codec, table
+# building and decrypt_block. The verbose encryption trace keeps mod_pow.
+ENGINE = 'sliding'
+
+def set_engine(name):
+    global ENGINE
+    modexp.get_engine(name)  # validates the name
+    ENGINE = name
 
 # Manual modular exponentiation: (base^exp) % mod
 def mod_pow(base, exp, mod):
@@ -18,6 +53,20 @@ def mod_pow(base, exp, mod):
         base = (base * base) % mod
     return result
 
+# Decrypt one block: m = c^d mod n
+# With a private key holding p and q this uses the Chinese Remainder Theorem:
+# two half-size exponentiations mod p and q instead of one mod n.
+def decrypt_block(c, key=DEFAULT_KEY, crt=True, engine=None):
+    if not isinstance(key, PrivateKey):
+        raise ValueError("decryption needs a private key")
+    power = modexp.get_engine(engine or ENGINE)
+    if not crt:
+        return power(c, key.d, key.n)
+    m1 = power(c % key.p, key.dP, key.p)
+    m2 = power(c % key.q, key.dQ, key.q)
+    h = (key.qInv * (m1 - m2)) % key.p
+    return m2 + h * key.q
+
 # Convert letter to number (A=01, B=02, ..., Z=26, space=00)
 def letter_to_number(letter):
     letter = letter.upper()
@@ -36,8 +85,145 @@ def number_to_letter(num):
         return chr(64 + num)  # A=65, so 64+1=A
     return '?'
 
+# Per-byte letter numbers (after ASCII upper-casing) and per-number letters,
+# matching letter_to_number / number_to_letter
+LETTER_NUMBERS = bytes(code - 64 if 65 <= code <= 90 else 0 for code in range(256))
+NUMBER_LETTERS = bytes(32 if num == 0 else 64 + num if num <= 26 else 63 for num in range(100))
+
+_tables = {}
+
+# Full encryption and decryption tables for a small modulus, built once.
+# Only n exponentiations are needed: the c->m table is the inverse of m->c.
+def get_tables(n=n, e=e):
+    key = (n, e)
+    if key not in _tables:
+        if n > TABLE_MAX_MODULUS:
+            raise ValueError(f"modulus {n} too large for lookup tables")
+        power = modexp.get_engine(ENGINE)
+        enc = [power(m, e, n) for m in range(n)]
+        dec = [0] * n
+        for m, c in enumerate(enc):
+            dec[c] = m
+        if np is not None:
+            enc = np.array(enc, dtype=np.int64)
+            dec = np.array(dec, dtype=np.int64)
+        _tables[key] = (enc, dec)
+    return _tables[key]
+
+# Letter pairs -> block values m = num1 * 100 + num2 (padded to even length)
+def message_to_blocks(message):
+    data = message.encode('ascii', 'replace').upper()
+    if len(data) % 2 != 0:
+        data += b' '
+    nums = data.translate(LETTER_NUMBERS)
+    if np is not None:
+        pairs = np.frombuffer(nums, dtype=np.uint8).astype(np.int64).reshape(-1, 2)
+        return pairs[:, 0] * 100 + pairs[:, 1]
+    return [nums[i] * 100 + nums[i + 1] for i in range(0, len(nums), 2)]
+
+# Block values -> letters (not stripped)
+def blocks_to_message(blocks):
+    if np is not None:
+        blocks = np.asarray(blocks, dtype=np.int64)
+        pairs = np.stack([np.minimum(blocks // 100, 99), blocks % 100], axis=1).ravel()
+        return np.frombuffer(NUMBER_LETTERS, dtype=np.uint8)[pairs].tobytes().decode('ascii')
+    letters = bytearray()
+    for m in blocks:
+        hi, lo = divmod(m, 100)
+        letters.append(NUMBER_LETTERS[hi] if hi < 100 else 63)
+        letters.append(NUMBER_LETTERS[lo])
+    return letters.decode('ascii')
+
+# Rough cost of one exponentiation: exponent bits times the cost of one
+# multiplication, which grows with the square of the modulus' 64-bit limbs
+# plus a fixed interpreter overhead
+def _pow_work(exp, mod):
+    limbs = mod.bit_length() // 64 + 1
+    return exp.bit_length() * (limbs * limbs + 64)
+
+def _use_pool(blocks, block_work, workers):
+    return workers > 1 and len(blocks) > 1 and len(blocks) * block_work >= PARALLEL_MIN_WORK
+
+# Pool workers: one chunk of blocks each. The engine name travels with the
+# chunk since a spawned worker does not see set_engine() calls.
+def _encrypt_chunk(args):
+    blocks, key, engine = args
+    power = modexp.get_engine(engine)
+    return [power(m, key.e, key.n) for m in blocks]
+
+def _decrypt_chunk(args):
+    blocks, key, crt, engine = args
+    return [decrypt_block(c, key, crt, engine) for c in blocks]
+
+# Run func over blocks split into ordered chunks; results come back in order.
+# Uses pool when given (so callers can share one across calls), otherwise
+# starts a pool of `workers` processes for this call.
+def _parallel_blocks(func, blocks, extra, workers, pool=None):
+    size = -(-len(blocks) // (workers * CHUNKS_PER_WORKER))
+    chunks = [(blocks[i:i + size],) + extra for i in range(0, len(blocks), size)]
+    if pool is not None:
+        return [x for part in pool.map(func, chunks) for x in part]
+    from multiprocessing import Pool
+    with Pool(workers) as pool:
+        return [x for part in pool.map(func, chunks) for x in part]
+
+# Plaintext block values m -> ciphertext blocks (table lookup for small moduli)
+# workers > 1 spreads the exponentiations over a process pool (pool, if given)
+def encrypt_values(blocks, key=DEFAULT_KEY, workers=1, pool=None):
+    if key.n <= TABLE_MAX_MODULUS:
+        enc, _ = get_tables(key.n, key.e)
+        if np is not None:
+            return enc[np.asarray(blocks, dtype=np.int64)].tolist()
+        return [enc[m] for m in blocks]
+    blocks = [int(m) for m in blocks]
+    if _use_pool(blocks, _pow_work(key.e, key.n), workers):
+        return _parallel_blocks(_encrypt_chunk, blocks, (key, ENGINE), workers, pool)
+    return _encrypt_chunk((blocks, key, ENGINE))
+
+# Quiet bulk encryption: table lookup for small moduli, the engine otherwise
+def encrypt_blocks(message, key=DEFAULT_KEY, workers=1):
+    return encrypt_values(message_to_blocks(message), key, workers)
+
+# Ciphertext blocks -> plaintext block values m
+# Small moduli use the lookup table, larger ones decrypt_block (CRT unless crt=False)
+def decrypt_values(encrypted_blocks, key=DEFAULT_KEY, crt=True, workers=1, pool=None):
+    if not isinstance(key, PrivateKey):
+        raise ValueError("decryption needs a private key")
+    use_table = key.n <= TABLE_MAX_MODULUS
+    if use_table and np is not None:
+        blocks = np.asarray(encrypted_blocks, dtype=np.int64)
+        low, high = (blocks.min(), blocks.max()) if blocks.size else (0, 0)
+    else:
+        blocks = encrypted_blocks.tolist() if hasattr(encrypted_blocks, 'tolist') else encrypted_blocks
+        low, high = (min(blocks), max(blocks)) if len(blocks) else (0, 0)
+    if low < 0 or high >= key.n:
+        raise ValueError(f"ciphertext block out of range for modulus {key.n}")
+    if use_table:
+        _, dec = get_tables(key.n, key.e)
+        if np is not None:
+            return dec[blocks]
+        return [dec[c] for c in blocks]
+    blocks = [int(c) for c in blocks]
+    if crt:
+        block_work = _pow_work(key.dP, key.p) + _pow_work(key.dQ, key.q)
+    else:
+        block_work = _pow_work(key.d, key.n)
+    if _use_pool(blocks, block_work, workers):
+        return _parallel_blocks(_decrypt_chunk, blocks, (key, crt, ENGINE), workers, pool)
+    return _decrypt_chunk((blocks, key, crt, ENGINE))
+
+# Quiet bulk decryption, the inverse of encrypt_blocks
+def decrypt_blocks(encrypted_blocks, key=DEFAULT_KEY, workers=1):
+    return blocks_to_message(decrypt_values(encrypted_blocks, key, workers=workers)).strip()
+
 # Encrypt message using RSA
-def encrypt_message(message):
+# verbose=True prints the step-by-step trace; otherwise the bulk codec is used
+# (in parallel with workers > 1)
+def encrypt_message(message, verbose=False, key=DEFAULT_KEY, workers=1):
+    if not verbose:
+        return encrypt_blocks(message, key, workers)
+    n, e = key.n, key.e
+
     print("\n" + "="*60)
     print("ENCRYPTION PROCESS")
     print("="*60)
@@ -80,7 +266,13 @@ def encrypt_message(message):
     return encrypted
 
 # Decrypt message using RSA
-def decrypt_message(encrypted_blocks):
+# verbose=True prints the step-by-step trace; otherwise the bulk codec is used
+# (in parallel with workers > 1)
+def decrypt_message(encrypted_blocks, verbose=False, key=DEFAULT_KEY, workers=1):
+    if not verbose:
+        return decrypt_blocks(encrypted_blocks, key, workers)
+    n, d = key.n, key.d
+
     print("\n" + "="*60)
     print("DECRYPTION PROCESS")
     print("="*60)
@@ -92,8 +284,8 @@ def decrypt_message(encrypted_blocks):
     decrypted = ""
     
     for idx, c in enumerate(encrypted_blocks):
-        # Decrypt: m = c^d mod n
-        m = mod_pow(c, d, n)
+        # Decrypt: m = c^d mod n (computed with the CRT)
+        m = decrypt_block(c, key)
         
         # Split back into two letters
         letter1_num = m // 100
@@ -117,8 +309,335 @@ def decrypt_message(encrypted_blocks):
     
     return decrypted
 
+# Packed block codec
+# Instead of two letters per block, pack as many symbols as the modulus
+# allows: radix 27 for the letter alphabet (space, A-Z) or radix 256 for raw
+# bytes. The symbol stream starts with its own length (enough digits for
+# 2^64) and is zero-padded to whole blocks, so decoding is lossless.
+# With a 2048-bit key that is 255 bytes per exponentiation.
+CODECS = {'letters': 27, 'bytes': 256}
+BASE27_DIGITS = b'0123456789abcdefghijklmnopq'
+SYMBOL_LETTERS = bytes(32 if v == 0 else 64 + v if v <= 26 else 63 for v in range(256))
+LETTERS_TO_BASE27 = bytes(BASE27_DIGITS[v] if v < 27 else 48 for v in range(256))
+
+def _codec_radix(codec):
+    if codec not in CODECS:
+        raise ValueError(f"unknown codec {codec!r}, expected one of {sorted(CODECS)}")
+    return CODECS[codec]
+
+# Symbols per block: the largest k with radix^k <= n, so every block is < n
+def packed_block_size(n, codec='bytes'):
+    radix = _codec_radix(codec)
+    k = 0
+    while radix ** (k + 1) <= n:
+        k += 1
+    if k == 0:
+        raise ValueError(f"modulus {n} too small for the {codec} codec")
+    return k
+
+# Digits needed to write any length up to 2^64 in the codec's radix
+def _length_digits(radix):
+    digits = 1
+    while radix ** digits < 1 << 64:
+        digits += 1
+    return digits
+
+# value -> exactly `count` big-endian digits in radix, as a bytes of digit values
+def _to_digits(value, radix, count):
+    if radix == 256:
+        return value.to_bytes(count, 'big')
+    digits = bytearray(count)
+    for i in range(count - 1, -1, -1):
+        value, digits[i] = divmod(value, radix)
+    return bytes(digits)
+
+# data -> symbol values: bytes as-is, letters through the A=1..Z=26 mapping
+def _to_symbols(data, codec):
+    if codec == 'bytes':
+        return data.encode('utf-8') if isinstance(data, str) else bytes(data)
+    return data.encode('ascii', 'replace').upper().translate(LETTER_NUMBERS)
+
+# Bytes codec blocks: len(data) must be a multiple of k
+def _bytes_to_values(data, k):
+    if np is not None and k == 1:
+        return np.frombuffer(data, dtype=np.uint8)
+    return [int.from_bytes(data[i:i + k], 'big') for i in range(0, len(data), k)]
+
+def _values_to_bytes(values, k):
+    if np is not None and k == 1:
+        values = np.asarray(values, dtype=np.int64)
+        if values.size and values.max() > 255:
+            raise ValueError("corrupt ciphertext: block does not decode to a byte")
+        return values.astype(np.uint8).tobytes()
+    try:
+        return b''.join(int(m).to_bytes(k, 'big') for m in values)
+    except OverflowError:
+        raise ValueError(f"corrupt ciphertext: block does not decode to {k} bytes") from None
+
+# Encrypt text (letters codec) or bytes (bytes codec; str is UTF-8 encoded)
+# into as few blocks as the key allows
+def encrypt_packed(data, key=DEFAULT_KEY, codec='bytes', workers=1, pool=None):
+    radix = _codec_radix(codec)
+    k = packed_block_size(key.n, codec)
+    symbols = _to_symbols(data, codec)
+    stream = _to_digits(len(symbols), radix, _length_digits(radix)) + symbols
+    stream += bytes(-len(stream) % k)
+    if radix == 256:
+        values = _bytes_to_values(stream, k)
+    else:
+        # int() parses base 27 in C once the digit values are mapped to '0'-'q'
+        digits = stream.translate(LETTERS_TO_BASE27)
+        values = [int(digits[i:i + k], 27) for i in range(0, len(stream), k)]
+    return encrypt_values(values, key, workers, pool)
+
+# Inverse of encrypt_packed: bytes for the bytes codec, str for letters
+def decrypt_packed(encrypted_blocks, key=DEFAULT_KEY, codec='bytes', workers=1, pool=None):
+    radix = _codec_radix(codec)
+    k = packed_block_size(key.n, codec)
+    values = decrypt_values(encrypted_blocks, key, workers=workers, pool=pool)
+    if radix == 256:
+        stream = _values_to_bytes(values, k)
+    else:
+        stream = b''.join(_to_digits(int(m), radix, k) for m in values)
+    prefix = _length_digits(radix)
+    if len(stream) < prefix:
+        raise ValueError("ciphertext too short for the length prefix")
+    length = int.from_bytes(stream[:prefix], 'big') if radix == 256 else \
+        int(stream[:prefix].translate(LETTERS_TO_BASE27), 27)
+    if prefix + length > len(stream):
+        raise ValueError("corrupt ciphertext: length prefix exceeds the data")
+    symbols = stream[prefix:prefix + length]
+    if codec == 'bytes':
+        return symbols
+    return symbols.translate(SYMBOL_LETTERS).decode('ascii')
+
+# Streaming file encryption
+# Files use the bytes codec's blocks, so any file round-trips exactly and
+# each exponentiation carries packed_block_size(n) bytes (255 at 2048 bits).
+# The total size is never needed up front (pipes and growing logs work): the
+# data ends with a 0x80 marker byte and zero padding to a whole block,
+# written as fixed-width big-endian ciphertext blocks (2 bytes for n=3233).
+# Input is processed chunk by chunk and partial blocks are carried into the
+# next chunk, so memory use does not depend on the input size.
+# codec='letters' keeps the original two-letters-per-block format, which
+# only preserves A-Z and space.
+DEFAULT_CHUNK_SIZE = 1 << 20
+FILE_CODECS = ('bytes', 'letters')
+
+def block_width(n=n):
+    return (n.bit_length() + 7) // 8
+
+# Integers -> fixed-width big-endian bytes
+def pack_blocks(blocks, width):
+    if np is not None and width in (1, 2, 4):
+        return np.asarray(blocks, dtype=f'>u{width}').tobytes()
+    return b''.join(c.to_bytes(width, 'big') for c in blocks)
+
+# Fixed-width big-endian bytes -> integers (len(data) must be a multiple of width)
+def unpack_blocks(data, width):
+    if np is not None and width in (1, 2, 4):
+        return np.frombuffer(data, dtype=f'>u{width}').astype(np.int64)
+    return [int.from_bytes(data[i:i + width], 'big') for i in range(0, len(data), width)]
+
+# Read a file object in fixed-size chunks
+def read_chunks(f, chunk_size=DEFAULT_CHUNK_SIZE):
+    if chunk_size < 1:
+        raise ValueError(f"chunk size must be at least 1, got {chunk_size}")
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+# Byte chunks -> ciphertext bytes (bytes codec blocks, end marker appended)
+def encrypt_stream(byte_chunks, key=DEFAULT_KEY, workers=1, pool=None):
+    k = packed_block_size(key.n)
+    width = block_width(key.n)
+    carry = b''
+    for chunk in byte_chunks:
+        data = carry + chunk
+        whole = len(data) - len(data) % k
+        data, carry = data[:whole], data[whole:]
+        if data:
+            yield pack_blocks(encrypt_values(_bytes_to_values(data, k), key, workers, pool), width)
+    carry += b'\x80'
+    carry += bytes(-len(carry) % k)
+    yield pack_blocks(encrypt_values(_bytes_to_values(carry, k), key), width)
+
+# Ciphertext byte chunks -> plaintext byte chunks, the inverse of encrypt_stream.
+# The last block is held back until the input ends, since it holds the marker.
+def decrypt_stream(byte_chunks, key=DEFAULT_KEY, workers=1, pool=None):
+    k = packed_block_size(key.n)
+    width = block_width(key.n)
+    carry = b''
+    held = b''
+    for chunk in byte_chunks:
+        data = carry + chunk
+        whole = len(data) - len(data) % width
+        data, carry = data[:whole], data[whole:]
+        if not data:
+            continue
+        plain = held + _values_to_bytes(decrypt_values(unpack_blocks(data, width), key,
+                                                       workers=workers, pool=pool), k)
+        held = plain[-k:]
+        if len(plain) > k:
+            yield plain[:-k]
+    if carry:
+        raise ValueError(f"truncated ciphertext: {len(carry)} trailing bytes")
+    last = held.rstrip(b'\0')
+    if not last.endswith(b'\x80'):
+        raise ValueError("truncated or corrupt ciphertext: end marker not found")
+    if len(last) > 1:
+        yield last[:-1]
+
+# Text chunks -> ciphertext bytes in the letter-pair format. A trailing odd
+# letter is carried into the next chunk so pairs never straddle a boundary;
+# the very last one is padded with a space.
+def encrypt_letter_stream(text_chunks, key=DEFAULT_KEY, workers=1, pool=None):
+    width = block_width(key.n)
+    carry = ''
+    for chunk in text_chunks:
+        text = carry + chunk
+        if len(text) % 2 != 0:
+            text, carry = text[:-1], text[-1]
+        else:
+            carry = ''
+        if text:
+            yield pack_blocks(encrypt_values(message_to_blocks(text), key, workers, pool), width)
+    if carry:
+        yield pack_blocks(encrypt_blocks(carry, key), width)
+
+# Letter-pair ciphertext byte chunks -> decrypted text chunks (not stripped).
+# A partial block at the end of a chunk is carried into the next one.
+def decrypt_letter_stream(byte_chunks, key=DEFAULT_KEY, workers=1, pool=None):
+    width = block_width(key.n)
+    carry = b''
+    for chunk in byte_chunks:
+        data = carry + chunk
+        whole = len(data) - len(data) % width
+        data, carry = data[:whole], data[whole:]
+        if data:
+            yield blocks_to_message(decrypt_values(unpack_blocks(data, width), key, workers=workers, pool=pool))
+    if carry:
+        raise ValueError(f"truncated ciphertext: {len(carry)} trailing bytes")
+
+# Encrypt (or decrypt) in_path into out_path; returns bytes (or, decrypting
+# with the letters codec, characters) written.
+# With workers > 1 one process pool is shared by every chunk. If anything
+# fails after out_path is opened, the partial output is removed (unless it is
+# a device or symlink such as /dev/stdout).
+def process_file(in_path, out_path, decrypt=False, chunk_size=DEFAULT_CHUNK_SIZE, key=DEFAULT_KEY,
+                 workers=1, codec='bytes'):
+    if codec not in FILE_CODECS:
+        raise ValueError(f"unknown codec {codec!r}, expected one of {list(FILE_CODECS)}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk size must be at least 1, got {chunk_size}")
+    if workers > 1 and key.n > TABLE_MAX_MODULUS:
+        from multiprocessing import Pool
+        with Pool(workers) as pool:
+            return _process_file(in_path, out_path, decrypt, chunk_size, key, workers, pool, codec)
+    return _process_file(in_path, out_path, decrypt, chunk_size, key, 1, None, codec)
+
+def _process_file(in_path, out_path, decrypt, chunk_size, key, workers, pool, codec):
+    if codec == 'letters' and not decrypt:
+        src = open(in_path, 'r', encoding='utf-8', errors='replace', newline='')
+    else:
+        src = open(in_path, 'rb')
+    with src:
+        if codec == 'letters' and decrypt:
+            stream = decrypt_letter_stream(read_chunks(src, chunk_size), key, workers, pool)
+            dst = open(out_path, 'w', encoding='ascii', newline='')
+        elif codec == 'letters':
+            stream = encrypt_letter_stream(read_chunks(src, chunk_size), key, workers, pool)
+            dst = open(out_path, 'wb')
+        elif decrypt:
+            # Whole ciphertext blocks per read
+            width = block_width(key.n)
+            chunk_size = max(width, chunk_size - chunk_size % width)
+            stream = decrypt_stream(read_chunks(src, chunk_size), key, workers, pool)
+            dst = open(out_path, 'wb')
+        else:
+            # Whole plaintext blocks per read
+            k = packed_block_size(key.n)
+            chunk_size = max(k, chunk_size - chunk_size % k)
+            stream = encrypt_stream(read_chunks(src, chunk_size), key, workers, pool)
+            dst = open(out_path, 'wb')
+        written = 0
+        try:
+            with dst:
+                for data in stream:
+                    written += dst.write(data)
+        except BaseException:
+            # Do not leave a partial result behind
+            if os.path.isfile(out_path) and not os.path.islink(out_path):
+                os.remove(out_path)
+            raise
+    return written
+
 # Main program
+# Interactive demo by default; file mode with
+#   python rsa_encryption.py --in plain.txt --out cipher.bin
+#   python rsa_encryption.py --decrypt --in cipher.bin --out plain.txt [--chunk-size N] [--workers N]
+#                            [--codec bytes|letters]
+# Either mode takes --key FILE (from rsa_keygen.py) instead of the demo key,
+# and --engine NAME to pick the exponentiation engine.
 if __name__ == "__main__":
+    key = DEFAULT_KEY
+    if '--key' in sys.argv:
+        try:
+            key_path = sys.argv[sys.argv.index('--key') + 1]
+            key = load_key(key_path)
+        except IndexError:
+            print("Usage: --key FILE")
+            sys.exit(2)
+        if not isinstance(key, PrivateKey) and ('--decrypt' in sys.argv or '--in' not in sys.argv):
+            # Only file encryption works with a public key
+            print(f"{key_path} is a public key; decryption needs the private key file")
+            print("Usage: python rsa_encryption.py [--decrypt] --in FILE --out FILE --key PRIVATE_KEY")
+            sys.exit(2)
+    if '--engine' in sys.argv:
+        try:
+            set_engine(sys.argv[sys.argv.index('--engine') + 1])
+        except (IndexError, ValueError):
+            print(f"Usage: --engine {'|'.join(modexp.ENGINES)}")
+            sys.exit(2)
+
+if __name__ == "__main__" and '--in' in sys.argv:
+    try:
+        in_path = sys.argv[sys.argv.index('--in') + 1]
+        out_path = sys.argv[sys.argv.index('--out') + 1]
+        chunk_size = DEFAULT_CHUNK_SIZE
+        if '--chunk-size' in sys.argv:
+            chunk_size = int(sys.argv[sys.argv.index('--chunk-size') + 1])
+            if chunk_size < 1:
+                raise ValueError(chunk_size)
+        workers = 1
+        if '--workers' in sys.argv:
+            workers = int(sys.argv[sys.argv.index('--workers') + 1])
+        codec = 'bytes'
+        if '--codec' in sys.argv:
+            codec = sys.argv[sys.argv.index('--codec') + 1]
+            if codec not in FILE_CODECS:
+                raise ValueError(codec)
+    except (ValueError, IndexError):
+        print("Usage: python rsa_encryption.py [--decrypt] --in FILE --out FILE [--chunk-size N] [--workers N]"
+              " [--codec bytes|letters]")
+        sys.exit(2)
+    decrypt = '--decrypt' in sys.argv
+    if codec == 'letters' and not decrypt:
+        print("Warning: --codec letters keeps only A-Z and space; other characters will not decrypt")
+    start = time.perf_counter()
+    try:
+        written = process_file(in_path, out_path, decrypt=decrypt, chunk_size=chunk_size, key=key,
+                               workers=workers, codec=codec)
+    except ValueError as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    unit = 'characters' if decrypt and codec == 'letters' else 'bytes'
+    print(f"{'Decrypted' if decrypt else 'Encrypted'} {in_path} -> {out_path}: "
+          f"{written} {unit} in {elapsed:.2f}s")
+elif __name__ == "__main__":
     print("\n" + "="*60)
     print("RSA ENCRYPTION/DECRYPTION DEMONSTRATION")
     print("="*60)
@@ -130,10 +649,10 @@ if __name__ == "__main__":
     message = input("\nEnter message to encrypt: ")
     
     # Encryption
-    encrypted_blocks = encrypt_message(message)
+    encrypted_blocks = encrypt_message(message, verbose=True, key=key)
     
     # Decryption
-    decrypted_message = decrypt_message(encrypted_blocks)
+    decrypted_message = decrypt_message(encrypted_blocks, verbose=True, key=key)
     
     # Verification
     print("\n" + "="*60)
@@ -0,0 +1,187 @@
+# RSA Key Generation
+# Miller-Rabin prime search (optionally spread over several processes),
+# key pairs carrying the CRT parameters, and key files on disk.
+#
+# Usage:
+#   python rsa_keygen.py --bits 2048 --out mykey.json [--workers 4]
+# writes the private key to mykey.json and the public key to mykey.json.pub
+
+import json
+import os
+import secrets
+import sys
+import time
+from collections import namedtuple
+from math import gcd
+
+MIN_KEY_BITS = 16
+MAX_KEY_BITS = 4096
+DEFAULT_KEY_BITS = 2048
+DEFAULT_E = 65537
+SEARCH_BATCH = 64  # candidates each worker tries per round
+
+SMALL_PRIMES = [p for p in range(3, 1000) if all(p % k for k in range(2, int(p ** 0.5) + 1))]
+# Bases that make Miller-Rabin deterministic below 3.3 * 10**24
+DETERMINISTIC_BASES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+PublicKey = namedtuple('PublicKey', 'n e')
+
+# Private key with the Chinese Remainder Theorem parameters:
+# dP = d mod (p-1), dQ = d mod (q-1), qInv = q^-1 mod p
+class PrivateKey(namedtuple('PrivateKey', 'n e d p q dP dQ qInv')):
+    __slots__ = ()
+
+    @property
+    def public_key(self):
+        return PublicKey(self.n, self.e)
+
+# Build a private key from two primes
+def make_private_key(p, q, e=DEFAULT_E):
+    if p == q:
+        raise ValueError("p and q must be distinct")
+    phi = (p - 1) * (q - 1)
+    if gcd(e, phi) != 1:
+        raise ValueError(f"e={e} is not invertible modulo (p-1)(q-1)")
+    d = pow(e, -1, phi)
+    return PrivateKey(p * q, e, d, p, q, d % (p - 1), d % (q - 1), pow(q, -1, p))
+
+# Miller-Rabin probable-prime test
+def is_probable_prime(n, rounds=40):
+    if n < 2:
+        return False
+    if n in (2, 3):
+        return True
+    if n % 2 == 0:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    # n - 1 = 2^s * r with r odd
+    r, s = n - 1, 0
+    while r % 2 == 0:
+        r //= 2
+        s += 1
+
+    if n < 3317044064679887385961981:
+        bases = DETERMINISTIC_BASES
+    else:
+        bases = [secrets.randbelow(n - 3) + 2 for _ in range(rounds)]
+    for a in bases:
+        x = pow(a, r, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+# Random odd candidate with the top two bits set, so p * q has full length
+def _random_candidate(bits):
+    return secrets.randbits(bits) | (0b11 << (bits - 2)) | 1
+
+# Pool worker: try a batch of random candidates, return a prime or None
+def _search_prime(args):
+    bits, e, tries = args
+    for _ in range(tries):
+        candidate = _random_candidate(bits)
+        if candidate % e != 1 and is_probable_prime(candidate):
+            return candidate
+    return None
+
+# Find `count` distinct primes of `bits` bits with p - 1 coprime to e.
+# With workers > 1 each round runs `workers` searches on pool (a
+# multiprocessing Pool, created here when not given).
+def generate_primes(bits, count=1, e=DEFAULT_E, workers=1, pool=None):
+    if workers > 1 and pool is None:
+        from multiprocessing import Pool
+        with Pool(workers) as pool:
+            return generate_primes(bits, count, e, workers, pool)
+    primes = []
+    while len(primes) < count:
+        if workers > 1:
+            found = pool.map(_search_prime, [(bits, e, SEARCH_BATCH)] * workers)
+        else:
+            found = [_search_prime((bits, e, SEARCH_BATCH))]
+        for p in found:
+            if p is not None and p not in primes and len(primes) < count:
+                primes.append(p)
+    return primes
+
+# Generate an RSA private key with an n of exactly `bits` bits
+def generate_keypair(bits=DEFAULT_KEY_BITS, e=DEFAULT_E, workers=1):
+    if not MIN_KEY_BITS <= bits <= MAX_KEY_BITS:
+        raise ValueError(f"key size must be between {MIN_KEY_BITS} and {MAX_KEY_BITS} bits")
+    if workers > 1:
+        # One pool for the whole key, not one per prime
+        from multiprocessing import Pool
+        with Pool(workers) as pool:
+            return _generate_keypair(bits, e, workers, pool)
+    return _generate_keypair(bits, e, 1, None)
+
+def _generate_keypair(bits, e, workers, pool):
+    half = bits // 2
+    while True:
+        if half == bits - half:
+            # Equal sizes: both primes can come out of the same round
+            p, q = generate_primes(half, 2, e, workers, pool)
+        else:
+            p, q = generate_primes(half, 1, e, workers, pool) + \
+                generate_primes(bits - half, 1, e, workers, pool)
+        if p == q:
+            continue
+        key = make_private_key(max(p, q), min(p, q), e)
+        if key.n.bit_length() == bits:
+            return key
+
+# Write a key (PublicKey or PrivateKey) as JSON with hex integers.
+# Private key files are created readable by the owner only.
+def save_key(key, path):
+    data = {'type': 'private' if isinstance(key, PrivateKey) else 'public'}
+    data.update((field, hex(value)) for field, value in zip(key._fields, key))
+    mode = 0o600 if isinstance(key, PrivateKey) else 0o644
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+# Read a key written by save_key
+def load_key(path):
+    with open(path) as f:
+        data = json.load(f)
+    cls = PrivateKey if data.get('type') == 'private' else PublicKey
+    try:
+        return cls(*(int(data[field], 16) for field in cls._fields))
+    except KeyError as missing:
+        raise ValueError(f"{path}: key file is missing {missing}") from None
+
+# Write a private key to path and its public half to path + '.pub'
+def save_keypair(key, path):
+    save_key(key, path)
+    save_key(key.public_key, path + '.pub')
+
+if __name__ == "__main__":
+    bits = DEFAULT_KEY_BITS
+    workers = 1
+    out_path = 'rsa_key.json'
+    try:
+        if '--bits' in sys.argv:
+            bits = int(sys.argv[sys.argv.index('--bits') + 1])
+        if '--workers' in sys.argv:
+            workers = int(sys.argv[sys.argv.index('--workers') + 1])
+        if '--out' in sys.argv:
+            out_path = sys.argv[sys.argv.index('--out') + 1]
+    except (ValueError, IndexError):
+        print("Usage: python rsa_keygen.py [--bits N] [--workers N] [--out FILE]")
+        sys.exit(2)
+
+    start = time.perf_counter()
+    key = generate_keypair(bits, workers=workers)
+    elapsed = time.perf_counter() - start
+    save_keypair(key, out_path)
+    print(f"Generated {bits}-bit key in {elapsed:.2f}s using {workers} worker(s)")
+    print(f"Private key: {out_path}")
+    print(f"Public key:  {out_path}.pub")
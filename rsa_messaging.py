@@ -0,0 +1,355 @@
+# Encrypted Messaging over asyncio
+# Python counterpart of server1.js / server2.js built on rsa_encryption.py,
+# with framing that survives TCP splitting and coalescing:
+#
+#   frame   = length (4 bytes, big-endian) + payload
+#   payload = type (1 byte) + message id (4 bytes) + body
+#
+# MESSAGE bodies are fixed-width ciphertext blocks from encrypt_packed
+# (bytes codec, so any UTF-8 text round-trips); the server answers each one
+# with an ACK, or an ERROR carrying a reason. Many clients can be connected
+# at once, writers wait on drain() for backpressure, and a client coalesces
+# every message queued in the same event-loop tick into a single write.
+#
+# Usage:
+#   python rsa_messaging.py serve [--port 3000] [--key FILE]
+#   python rsa_messaging.py send  [--port 3000] [--key FILE.pub]   # one message per stdin line
+#   python rsa_messaging.py load  [--clients 20] [--messages 500] [--size 64] [--window 64]
+#                                 [--port P to use a running server, otherwise one is started]
+
+import asyncio
+import struct
+import sys
+import time
+
+from rsa_encryption import (DEFAULT_KEY, TABLE_MAX_MODULUS, block_width, pack_blocks,
+                            unpack_blocks, encrypt_packed, decrypt_packed)
+from rsa_keygen import PrivateKey, load_key
+
+HOST = 'localhost'
+PORT = 3000
+MAX_FRAME = 16 * 1024 * 1024  # larger frames are treated as a protocol error
+
+MESSAGE = 1
+ACK = 2
+ERROR = 3
+
+HEADER = struct.Struct('>I')
+PAYLOAD_HEADER = struct.Struct('>BI')
+
+class ProtocolError(Exception):
+    pass
+
+# Frame helpers
+def make_frame(kind, msg_id, body=b''):
+    payload_len = PAYLOAD_HEADER.size + len(body)
+    return HEADER.pack(payload_len) + PAYLOAD_HEADER.pack(kind, msg_id) + body
+
+# Read one frame; returns (kind, msg_id, body) or None on a clean EOF
+async def read_frame(reader):
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError as err:
+        if err.partial:
+            raise ProtocolError("connection closed inside a frame header")
+        return None
+    (length,) = HEADER.unpack(header)
+    if not PAYLOAD_HEADER.size <= length <= MAX_FRAME:
+        raise ProtocolError(f"bad frame length {length}")
+    try:
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        raise ProtocolError("connection closed inside a frame")
+    kind, msg_id = PAYLOAD_HEADER.unpack_from(payload)
+    return kind, msg_id, payload[PAYLOAD_HEADER.size:]
+
+# Message codec
+def encrypt_text(text, key):
+    return pack_blocks(encrypt_packed(text, key), block_width(key.n))
+
+def decrypt_text(body, key):
+    width = block_width(key.n)
+    if len(body) % width:
+        raise ValueError("ciphertext is not a whole number of blocks")
+    return decrypt_packed(unpack_blocks(body, width), key).decode('utf-8')
+
+# Server
+class MessageServer:
+    def __init__(self, key=DEFAULT_KEY, on_message=None):
+        """
+        key: private key used to decrypt incoming messages
+        on_message: callback(peer, text) for every decrypted message
+        """
+        self.key = key
+        self.on_message = on_message
+        self.clients = 0
+        self.received = 0
+        self.server = None
+        self.connections = {}  # handler task -> writer
+
+    async def start(self, host=HOST, port=PORT):
+        self.server = await asyncio.start_server(self._handle_client, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Stop listening, disconnect every client and wait for their handlers"""
+        if self.server is None:
+            return
+        self.server.close()
+        for writer in self.connections.values():
+            writer.close()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def _decrypt(self, body):
+        if self.key.n <= TABLE_MAX_MODULUS:
+            return decrypt_text(body, self.key)
+        # Large-key decryption would stall every other client; run it off the loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, decrypt_text, body, self.key)
+
+    async def _handle_client(self, reader, writer):
+        peer = writer.get_extra_info('peername')
+        task = asyncio.current_task()
+        self.connections[task] = writer
+        self.clients += 1
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                kind, msg_id, body = frame
+                if kind != MESSAGE:
+                    raise ProtocolError(f"unexpected frame type {kind}")
+                try:
+                    text = await self._decrypt(body)
+                except ValueError as err:
+                    writer.write(make_frame(ERROR, msg_id, str(err).encode('utf-8')))
+                else:
+                    self.received += 1
+                    if self.on_message is not None:
+                        self.on_message(peer, text)
+                    writer.write(make_frame(ACK, msg_id))
+                # Backpressure: wait here while the client is not reading acks
+                await writer.drain()
+        except ProtocolError as err:
+            print(f"Server: dropping {peer}: {err}")
+        except ConnectionError:
+            pass
+        finally:
+            self.clients -= 1
+            del self.connections[task]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+# Client
+class MessageClient:
+    def __init__(self, reader, writer, key):
+        self.reader = reader
+        self.writer = writer
+        self.key = key
+        self.next_id = 0
+        self.waiting = {}
+        self.pending = []
+        self.flush_task = None
+        self.error = None
+        self.reader_task = asyncio.ensure_future(self._read_acks())
+
+    @classmethod
+    async def connect(cls, host=HOST, port=PORT, key=DEFAULT_KEY):
+        """key: public (or private) key used to encrypt outgoing messages"""
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer, key)
+
+    async def send(self, text):
+        """Encrypt and send text; returns once the server has acknowledged it"""
+        if self.error is not None:
+            raise ConnectionError(str(self.error))
+        msg_id = self.next_id
+        self.next_id = (self.next_id + 1) & 0xFFFFFFFF
+        ack = asyncio.get_running_loop().create_future()
+        self.waiting[msg_id] = ack
+        self.pending.append(make_frame(MESSAGE, msg_id, encrypt_text(text, self.key)))
+        if self.flush_task is None:
+            self.flush_task = asyncio.ensure_future(self._flush())
+        await ack
+
+    async def _flush(self):
+        # Runs after the current tick, so every send() queued meanwhile
+        # goes out in one write
+        try:
+            while self.pending:
+                data = b''.join(self.pending)
+                self.pending.clear()
+                self.writer.write(data)
+                await self.writer.drain()
+        except ConnectionError as err:
+            self._fail_all(err)
+        finally:
+            self.flush_task = None
+
+    async def _read_acks(self):
+        try:
+            while True:
+                frame = await read_frame(self.reader)
+                if frame is None:
+                    raise ConnectionError("server closed the connection")
+                kind, msg_id, body = frame
+                ack = self.waiting.pop(msg_id, None)
+                if ack is None or ack.done():
+                    continue
+                if kind == ACK:
+                    ack.set_result(None)
+                else:
+                    ack.set_exception(ProtocolError(body.decode('utf-8', 'replace')))
+        except (ConnectionError, ProtocolError) as err:
+            self._fail_all(err)
+
+    def _fail_all(self, err):
+        self.error = err
+        for ack in self.waiting.values():
+            if not ack.done():
+                ack.set_exception(ConnectionError(str(err)))
+        self.waiting.clear()
+
+    async def close(self):
+        if self.flush_task is not None:
+            await self.flush_task
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        self.reader_task.cancel()
+
+# Load generator
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+async def run_load(host=HOST, port=None, key=DEFAULT_KEY, clients=20, messages=500, size=64, window=64):
+    """
+    Open `clients` connections, each sending `messages` messages of `size`
+    characters with at most `window` unacknowledged at a time.
+    Starts a local server when port is None. Returns a stats dict.
+    """
+    server = None
+    if port is None:
+        server = MessageServer(key)
+        port = await server.start(host, 0)
+    payload = ('The quick brown fox jumps over the lazy dog. ' * (size // 45 + 1))[:size]
+    latencies = []
+
+    async def one_client():
+        client = await MessageClient.connect(host, port, key)
+        slots = asyncio.Semaphore(window)
+
+        async def one_message():
+            async with slots:
+                sent = time.perf_counter()
+                await client.send(payload)
+                latencies.append(time.perf_counter() - sent)
+
+        await asyncio.gather(*(one_message() for _ in range(messages)))
+        await client.close()
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(one_client() for _ in range(clients)))
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    total = len(latencies)
+    return {
+        'clients': clients,
+        'messages': total,
+        'message_size': size,
+        'seconds': elapsed,
+        'messages_per_sec': total / elapsed if elapsed else float('inf'),
+        'latency_ms': {
+            'p50': _percentile(latencies, 0.50) * 1000,
+            'p95': _percentile(latencies, 0.95) * 1000,
+            'p99': _percentile(latencies, 0.99) * 1000,
+            'max': (latencies[-1] if latencies else 0.0) * 1000,
+        },
+    }
+
+def print_load(stats):
+    lat = stats['latency_ms']
+    print(f"{stats['messages']} messages of {stats['message_size']} chars from "
+          f"{stats['clients']} clients in {stats['seconds']:.2f}s")
+    print(f"  throughput: {stats['messages_per_sec']:,.0f} messages/sec")
+    print(f"  latency: p50 {lat['p50']:.2f}ms  p95 {lat['p95']:.2f}ms  "
+          f"p99 {lat['p99']:.2f}ms  max {lat['max']:.2f}ms")
+
+# Command line
+async def serve(host, port, key):
+    def show(peer, text):
+        print(f"Received from {peer[0]}:{peer[1]}: {text}")
+
+    server = MessageServer(key, on_message=show)
+    port = await server.start(host, port)
+    print(f"Server listening on {host}:{port}")
+    print(f"RSA Private Key (n, d) = ({key.n}, {key.d})" if key.n <= TABLE_MAX_MODULUS
+          else f"RSA {key.n.bit_length()}-bit private key loaded")
+    async with server.server:
+        await server.server.serve_forever()
+
+async def send_lines(host, port, key):
+    client = await MessageClient.connect(host, port, key)
+    print(f"Connected to {host}:{port}. Type messages to encrypt and send:")
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            await client.send(line.rstrip('\n'))
+            print("Sent and acknowledged")
+    finally:
+        await client.close()
+
+def _arg(name, default, cast=int):
+    if name in sys.argv:
+        try:
+            return cast(sys.argv[sys.argv.index(name) + 1])
+        except (IndexError, ValueError):
+            print(f"Invalid value for {name}")
+            sys.exit(2)
+    return default
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'serve'
+    key_path = _arg('--key', None, str)
+    key = load_key(key_path) if key_path else DEFAULT_KEY
+    # serve, and load without --port (it starts its own server), decrypt
+    needs_private = command == 'serve' or (command == 'load' and '--port' not in sys.argv)
+    if needs_private and not isinstance(key, PrivateKey):
+        print(f"{key_path} is a public key; the server needs the private key file to decrypt")
+        print(f"Usage: python rsa_messaging.py {command} [--port 3000] [--key PRIVATE_KEY]")
+        sys.exit(2)
+    host = _arg('--host', HOST, str)
+    try:
+        if command == 'serve':
+            asyncio.run(serve(host, _arg('--port', PORT), key))
+        elif command == 'send':
+            asyncio.run(send_lines(host, _arg('--port', PORT), key))
+        elif command == 'load':
+            stats = asyncio.run(run_load(host, _arg('--port', None), key,
+                                         clients=_arg('--clients', 20),
+                                         messages=_arg('--messages', 500),
+                                         size=_arg('--size', 64),
+                                         window=_arg('--window', 64)))
+            print_load(stats)
+        else:
+            print("Usage: python rsa_messaging.py serve|send|load [options]")
+            sys.exit(2)
+    except KeyboardInterrupt:
+        print("\nExiting.")